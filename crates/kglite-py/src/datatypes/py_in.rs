@@ -140,10 +140,16 @@ fn convert_pandas_series(series: &Bound<'_, PyAny>, col_type: ColumnType) -> PyR
 
     // Get the null mask from pandas — this correctly handles None, np.nan, pd.NA, pd.NaT
     // regardless of pandas version or dtype backend (object, string[python], string[pyarrow], etc.)
-    let null_mask: Vec<bool> = series
-        .call_method0("isna")?
-        .call_method0("tolist")?
-        .extract()?;
+    // Plain NumPy integer and bool columns cannot hold a missing value, so
+    // their mask is known without another pass over the column.
+    let null_mask: Vec<bool> = if dtype_cannot_hold_nulls(series)? {
+        vec![false; length]
+    } else {
+        series
+            .call_method0("isna")?
+            .call_method0("tolist")?
+            .extract()?
+    };
 
     // Convert series to Python list once — PyList.get_item() is O(1) C-level array access,
     // whereas Series.get_item() goes through pandas' label-aware indexing with dtype dispatch.
@@ -151,116 +157,39 @@ fn convert_pandas_series(series: &Bound<'_, PyAny>, col_type: ColumnType) -> PyR
     let py_list = series.call_method0("tolist")?;
 
     match col_type {
-        ColumnType::Float64 => {
-            // Fast path: try batch extraction (works when column has no mixed types)
-            match py_list.extract::<Vec<Option<f64>>>() {
-                Ok(mut values) => {
-                    // Apply null mask — pandas NaN extracts as Some(NaN), not None
-                    for (i, &is_null) in null_mask.iter().enumerate() {
-                        if is_null {
-                            values[i] = None;
-                        }
-                    }
-                    Ok(ColumnData::Float64(values))
-                }
-                Err(_) => {
-                    // Fallback: per-element with null mask (mixed types or special values)
-                    let py_list = py_list.cast::<PyList>()?;
-                    let mut vec = Vec::with_capacity(length);
-                    for (i, &is_null) in null_mask.iter().enumerate() {
-                        if is_null {
-                            vec.push(None);
-                        } else {
-                            let item = py_list.get_item(i)?;
-                            vec.push(to_f64(&item));
-                        }
-                    }
-                    Ok(ColumnData::Float64(vec))
-                }
-            }
-        }
-        ColumnType::Boolean => {
-            // Fast path: try batch extraction
-            match py_list.extract::<Vec<Option<bool>>>() {
-                Ok(mut values) => {
-                    // Apply null mask — pd.NA may not extract as None
-                    for (i, &is_null) in null_mask.iter().enumerate() {
-                        if is_null {
-                            values[i] = None;
-                        }
-                    }
-                    Ok(ColumnData::Boolean(values))
-                }
-                Err(_) => {
-                    let py_list = py_list.cast::<PyList>()?;
-                    let mut vec = Vec::with_capacity(length);
-                    for (i, &is_null) in null_mask.iter().enumerate() {
-                        if is_null {
-                            vec.push(None);
-                        } else {
-                            let item = py_list.get_item(i)?;
-                            vec.push(to_bool(&item));
-                        }
-                    }
-                    Ok(ColumnData::Boolean(vec))
-                }
-            }
-        }
-        ColumnType::String => {
-            // Fast path: try batch extraction
-            match py_list.extract::<Vec<Option<String>>>() {
-                Ok(mut values) => {
-                    // Apply null mask for safety
-                    for (i, &is_null) in null_mask.iter().enumerate() {
-                        if is_null {
-                            values[i] = None;
-                        }
-                    }
-                    Ok(ColumnData::String(values))
-                }
-                Err(_) => {
-                    let py_list = py_list.cast::<PyList>()?;
-                    let mut vec = Vec::with_capacity(length);
-                    for (i, &is_null) in null_mask.iter().enumerate() {
-                        if is_null {
-                            vec.push(None);
-                        } else {
-                            let item = py_list.get_item(i)?;
-                            vec.push(item.str().ok().map(|s| s.to_string()));
-                        }
-                    }
-                    Ok(ColumnData::String(vec))
-                }
-            }
-        }
-        ColumnType::Int64 => {
-            // Int64 columns may contain numpy int64 which doesn't batch-extract to i64,
-            // so use per-element with PyList (still much faster than Series indexing)
-            let py_list = py_list.cast::<PyList>()?;
-            let mut vec = Vec::with_capacity(length);
-            for (i, &is_null) in null_mask.iter().enumerate() {
-                if is_null {
-                    vec.push(None);
-                } else {
-                    let item = py_list.get_item(i)?;
-                    vec.push(to_i64(&item));
-                }
-            }
-            Ok(ColumnData::Int64(vec))
-        }
-        ColumnType::UniqueId => {
-            let py_list = py_list.cast::<PyList>()?;
-            let mut vec = Vec::with_capacity(length);
-            for (i, &is_null) in null_mask.iter().enumerate() {
-                if is_null {
-                    vec.push(None);
-                } else {
-                    let item = py_list.get_item(i)?;
-                    vec.push(to_u32(&item));
-                }
-            }
-            Ok(ColumnData::UniqueId(vec))
-        }
+        // Fast path for each: batch extraction, which works when the column
+        // has no mixed types. Object columns may hold numpy scalars, floats
+        // or strings, which fall back to per-element conversion.
+        ColumnType::Float64 => Ok(ColumnData::Float64(mask_column(
+            py_list.extract().ok(),
+            &py_list,
+            &null_mask,
+            to_f64,
+        )?)),
+        ColumnType::Boolean => Ok(ColumnData::Boolean(mask_column(
+            py_list.extract().ok(),
+            &py_list,
+            &null_mask,
+            to_bool,
+        )?)),
+        ColumnType::String => Ok(ColumnData::String(mask_column(
+            py_list.extract().ok(),
+            &py_list,
+            &null_mask,
+            |item| item.str().ok().map(|s| s.to_string()),
+        )?)),
+        ColumnType::Int64 => Ok(ColumnData::Int64(mask_column(
+            py_list.extract().ok(),
+            &py_list,
+            &null_mask,
+            to_i64,
+        )?)),
+        ColumnType::UniqueId => Ok(ColumnData::UniqueId(mask_column(
+            py_list.extract().ok(),
+            &py_list,
+            &null_mask,
+            to_u32,
+        )?)),
         ColumnType::DateTime => {
             // DateTime needs custom parsing — use PyList for O(1) access
             let py_list = py_list.cast::<PyList>()?;
@@ -329,6 +258,49 @@ fn convert_pandas_series(series: &Bound<'_, PyAny>, col_type: ColumnType) -> PyR
     }
 }
 
+/// One column of `convert_pandas_series`. `batch` is the whole-list
+/// extraction, if every cell already had the target type; the null mask
+/// still wins there (pandas NaN and pd.NA can extract as values). Without
+/// it, each non-null cell of `py_list` goes through `convert`.
+fn mask_column<'py, T>(
+    batch: Option<Vec<Option<T>>>,
+    py_list: &Bound<'py, PyAny>,
+    null_mask: &[bool],
+    convert: impl Fn(&Bound<'py, PyAny>) -> Option<T>,
+) -> PyResult<Vec<Option<T>>> {
+    if let Some(mut values) = batch {
+        for (value, &is_null) in values.iter_mut().zip(null_mask) {
+            if is_null {
+                *value = None;
+            }
+        }
+        return Ok(values);
+    }
+    let py_list = py_list.cast::<PyList>()?;
+    let mut vec = Vec::with_capacity(null_mask.len());
+    for (i, &is_null) in null_mask.iter().enumerate() {
+        if is_null {
+            vec.push(None);
+        } else {
+            let item = py_list.get_item(i)?;
+            vec.push(convert(&item));
+        }
+    }
+    Ok(vec)
+}
+
+/// True for the plain NumPy integer and bool dtypes the loader accepts, which
+/// have no missing-value representation. Pandas' nullable `Int64` / `boolean`
+/// extension dtypes spell their names differently and still get a real null
+/// mask.
+fn dtype_cannot_hold_nulls(series: &Bound<'_, PyAny>) -> PyResult<bool> {
+    let dtype = series.getattr("dtype")?.str()?.to_string();
+    Ok(matches!(
+        dtype.as_str(),
+        "int64" | "int32" | "int16" | "int8" | "bool"
+    ))
+}
+
 /// Convert a single pandas cell into a `Vec<Value>`. A Python list/tuple maps
 /// element-wise via [`py_value_to_value`]; a numpy array converts through
 /// `.tolist()` (1-D → flat list, multi-D → nested lists); any scalar is
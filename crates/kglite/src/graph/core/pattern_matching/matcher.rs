@@ -5,10 +5,12 @@
 // paths, and Rayon-parallelised expansion for large match sets.
 
 use crate::datatypes::values::Value;
+use crate::graph::algorithms::Interrupt;
 use crate::graph::core::filtering::{compare_values, values_equal};
 use crate::graph::languages::cypher::result::Bindings;
+use crate::graph::mutation::subgraph_streaming::Bitset;
 use crate::graph::schema::{DirGraph, InternedKey};
-use crate::graph::storage::GraphRead;
+use crate::graph::storage::{GraphRead, MemoryTypedAdjacency};
 use petgraph::graph::NodeIndex;
 use petgraph::Direction;
 use rayon::prelude::*;
@@ -16,12 +18,14 @@ use rustc_hash::FxHashMap;
 use std::borrow::Cow;
 use std::collections::{HashMap, HashSet};
 use std::sync::atomic::AtomicBool;
+use std::sync::Arc;
 use std::time::Instant;
 
 use super::pattern::{
     AnchorSide, EdgeDirection, EdgePattern, MatchBinding, NodePattern, PathHop, Pattern,
     PatternElement, PatternMatch, PropertyMatcher,
 };
+use super::reach::HopWalk;
 
 /// Minimum match count to use parallel expansion via rayon.
 /// Set high: each expand_from_node does light work (a few edge iterations),
@@ -29,6 +33,18 @@ use super::pattern::{
 /// contention when multiple queries run concurrently (shared thread pool).
 const EXPANSION_RAYON_THRESHOLD: usize = 8192;
 
+/// Minimum typed-edge count before a multi-seed reach count runs its
+/// per-seed BFSs in parallel. Below it a whole BFS is a few microseconds and
+/// thread hand-off plus one private bitset per seed cost more than they save.
+const REACH_RAYON_MIN_EDGES: usize = 1 << 16;
+
+/// Fewest kept seeds for which a reach count may build the per-type CSR
+/// adjacency. The build scans every edge in the graph, while one seed's walk
+/// touches only the edges of the type it can reach, so a lone seed only uses
+/// an adjacency an earlier query left cached. More seeds still have to pass
+/// the cost estimate in [`PatternExecutor::typed_csr_pays_off`].
+const REACH_CSR_MIN_SEEDS: usize = 2;
+
 /// Whether adding `candidate` would reuse a relationship already consumed by
 /// this pattern match. Cypher paths are trails: nodes may repeat, edges may not.
 fn reuses_bound_relationship(current: &PatternMatch, candidate: &MatchBinding) -> bool {
@@ -265,6 +281,16 @@ impl<'a> PatternExecutor<'a> {
         None
     }
 
+    /// This matcher's deadline + cancel flag as an [`Interrupt`], for the
+    /// kernels that poll on their own cadence instead of through
+    /// [`Self::interrupt_reason`].
+    fn interrupt(&self) -> Interrupt {
+        Interrupt {
+            deadline: self.deadline,
+            cancel: self.cancel,
+        }
+    }
+
     /// Set a distinct target variable for deduplication during pattern matching.
     /// At the last hop, paths leading to already-seen target NodeIndex values
     /// are skipped, avoiding PatternMatch cloning overhead.
@@ -1767,10 +1793,175 @@ impl<'a> PatternExecutor<'a> {
         Ok(results)
     }
 
+    /// Count the distinct targets of `(a)-[:T*min..max]->(b)` across every
+    /// node matching `a` that passes `keep_seed` (whose errors propagate),
+    /// without building a binding per target: each seed's BFS levels are
+    /// unioned into one bitset and the answer is its popcount, so no
+    /// per-target dedup set is needed. On a large adjacency the seeds' BFSs
+    /// run in parallel into private bitsets that are OR-ed together. Same
+    /// reach semantics as [`Self::expand_var_length_fast`]. Returns `None`
+    /// when the pattern is not a single typed var-length hop, the type has
+    /// no edges, the backend keeps no per-type adjacency, or none is cached
+    /// and building one would not pay off (see [`Self::typed_csr_pays_off`]),
+    /// so the caller can run the row-producing plan instead.
+    pub fn count_distinct_var_length_targets(
+        &self,
+        pattern: &Pattern,
+        mut keep_seed: impl FnMut(NodeIndex) -> Result<bool, String>,
+    ) -> Result<Option<usize>, String> {
+        let (source, edge_pattern, node_pattern) = match pattern.elements.as_slice() {
+            [PatternElement::Node(s), PatternElement::Edge(e), PatternElement::Node(t)] => {
+                (s, e, t)
+            }
+            _ => return Ok(None),
+        };
+        let (min_hops, max_hops) = match edge_pattern.var_length {
+            Some(range) => range,
+            None => return Ok(None),
+        };
+        let conn_type = match edge_pattern.connection_type {
+            Some(ref ct) => ct.as_str(),
+            None => return Ok(None),
+        };
+        let conn_key = InternedKey::from_str(conn_type);
+        let directions: &[Direction] = match edge_pattern.direction {
+            EdgeDirection::Outgoing => &[Direction::Outgoing],
+            EdgeDirection::Incoming => &[Direction::Incoming],
+            EdgeDirection::Both => &[Direction::Outgoing, Direction::Incoming],
+        };
+
+        let mut seeds = Vec::new();
+        for seed in self.find_matching_nodes(source)? {
+            if let Some(msg) = self.interrupt_reason() {
+                return Err(msg);
+            }
+            if keep_seed(seed)? {
+                seeds.push(seed);
+            }
+        }
+
+        let backend = &self.graph.graph;
+        let adjacency = if self.typed_csr_pays_off(conn_type, seeds.len(), directions.len()) {
+            backend.cached_typed_adjacency(conn_key, self.deadline)?
+        } else {
+            backend.existing_typed_adjacency(conn_key)
+        };
+        let adjacency = match adjacency {
+            Some(adjacency) => adjacency,
+            None => return Ok(None),
+        };
+
+        let props_match = |node: NodeIndex| match node_pattern.properties {
+            Some(ref props) => self.node_matches_properties(node, props),
+            None => true,
+        };
+
+        // With no target filter left to apply and no lower bound past the
+        // first hop, a seed's reach is its whole BFS visited set, so it is
+        // OR-ed in a block at a time instead of node by node.
+        let unfiltered_targets = (edge_pattern.skip_target_type_check
+            || (node_pattern.node_type.is_none() && node_pattern.extra_labels.is_empty()))
+            && node_pattern.properties.is_none();
+
+        // Zero hops make a seed its own target. A seed with no edge of the
+        // type has no local id in the adjacency and no walk reaches it, so
+        // it is counted here instead of in the bitset.
+        let seed_is_target = |seed: NodeIndex| {
+            min_hops == 0
+                && self.node_matches_pattern_labels(seed, node_pattern)
+                && props_match(seed)
+        };
+        let mut isolated_targets = 0;
+        let mut local_seeds = Vec::with_capacity(seeds.len());
+        for seed in seeds {
+            match adjacency.local_id(seed) {
+                Some(local) => local_seeds.push(local),
+                None => isolated_targets += usize::from(seed_is_target(seed)),
+            }
+        }
+
+        let walk_from = |seed: u32| HopWalk {
+            adjacency: &adjacency,
+            directions,
+            seed,
+            min_hops,
+            max_hops,
+            interrupt: self.interrupt(),
+        };
+
+        // OR one seed's contribution into `reached`, over local ids.
+        let add_seed = |reached: &mut Bitset, seed: u32| -> Result<(), String> {
+            if seed_is_target(adjacency.node_index(seed)) {
+                reached.set(seed as usize);
+            }
+            if unfiltered_targets && min_hops <= 1 {
+                let within = super::reach::reach_within(&walk_from(seed))?;
+                reached.union_with(&within);
+                return Ok(());
+            }
+            super::reach::for_each_hop_level(&walk_from(seed), |_, nodes| {
+                for &node in nodes {
+                    if reached.get(node as usize) {
+                        continue;
+                    }
+                    let target = adjacency.node_index(node);
+                    if (edge_pattern.skip_target_type_check
+                        || self.node_matches_pattern_labels(target, node_pattern))
+                        && props_match(target)
+                    {
+                        reached.set(node as usize);
+                    }
+                }
+            })
+        };
+
+        // Only a large adjacency repays a rayon thread and bitset per seed.
+        let parallel =
+            local_seeds.len() > 1 && adjacency.out_targets.len() >= REACH_RAYON_MIN_EDGES;
+        let reached = super::reach::union_seed_reaches(
+            local_seeds,
+            adjacency.node_count(),
+            parallel,
+            self.interrupt(),
+            add_seed,
+        )?;
+        Ok(Some(reached.count_ones() as usize + isolated_targets))
+    }
+
+    /// Whether a reach count from `seeds` seeds should build `conn_type`'s
+    /// CSR adjacency rather than fall back to the row plan. The build scans
+    /// every edge in the graph once; each seed's walk over the edge lists
+    /// touches at most the type's own edges once per direction, so the build
+    /// can only pay off when `seeds × directions × typed edges` reaches the
+    /// graph's edge count. The typed edge count comes from the edge-type
+    /// count cache when it is populated, as join ordering reads it; without
+    /// it only the [`REACH_CSR_MIN_SEEDS`] floor applies.
+    fn typed_csr_pays_off(&self, conn_type: &str, seeds: usize, directions: usize) -> bool {
+        if seeds < REACH_CSR_MIN_SEEDS {
+            return false;
+        }
+        if !self.graph.has_edge_type_counts_cache() {
+            return true;
+        }
+        let typed_edges = self
+            .graph
+            .get_edge_type_counts()
+            .get(conn_type)
+            .copied()
+            .unwrap_or(0);
+        seeds.saturating_mul(directions).saturating_mul(typed_edges)
+            >= self.graph.graph.edge_count()
+    }
+
     /// Fast variable-length path expansion using global BFS dedup.
     /// Used when path info is not needed (no `p = ...`, no named edge variable).
     /// Each node is visited at most once, eliminating redundant re-exploration
     /// from hub nodes at deeper depths.
+    ///
+    /// An order-insensitive consumer (`targets_unordered`) of a single-type,
+    /// property-free edge on the heap backend hands the walk to the
+    /// direction-optimizing level BFS when that type's CSR adjacency is
+    /// already cached; everything else walks petgraph's edge lists.
     fn expand_var_length_fast(
         &self,
         source: NodeIndex,
@@ -1801,14 +1992,7 @@ impl<'a> PatternExecutor<'a> {
             None
         };
 
-        // Global visited set — each node is explored at most once.
-        // Vec<bool> is faster than HashSet for dense NodeIndex (no hashing, cache-friendly).
-        let mut visited = vec![false; self.graph.graph.node_bound()];
-        visited[source.index()] = true;
-
-        // Queue: (node, depth) — no path vector needed
-        let mut queue: VecDeque<(NodeIndex, usize)> = VecDeque::new();
-        queue.push_back((source, 0));
+        let adjacency = self.cached_unordered_adjacency(edge_pattern, conn_key);
 
         let mut results = Vec::new();
 
@@ -1833,6 +2017,40 @@ impl<'a> PatternExecutor<'a> {
             }
         }
 
+        // Order-insensitive consumer (see `targets_unordered`): hand the
+        // whole traversal to the direction-optimizing level BFS. A source
+        // with no edge of the type has no local id and reaches nothing.
+        if let Some(ref adjacency) = adjacency {
+            if let Some(seed) = adjacency.local_id(source) {
+                let walk = HopWalk {
+                    adjacency,
+                    directions,
+                    seed,
+                    min_hops,
+                    max_hops,
+                    interrupt: self.interrupt(),
+                };
+                self.push_hop_level_targets(
+                    &walk,
+                    source,
+                    edge_pattern,
+                    node_pattern,
+                    &mut results,
+                )?;
+            }
+            return Ok(results);
+        }
+
+        // Global visited set — each node is explored at most once. One bit
+        // per dense NodeIndex: no hashing, and 8× less memory traffic than a
+        // Vec<bool>, so the set for a 100K-node graph stays in L1.
+        let mut visited = Bitset::with_len(self.graph.graph.node_bound());
+        visited.set(source.index());
+
+        // Queue: (node, depth) — no path vector needed
+        let mut queue: VecDeque<(NodeIndex, usize)> = VecDeque::new();
+        queue.push_back((source, 0));
+
         let mut iter_count: usize = 0;
 
         while let Some((current, depth)) = queue.pop_front() {
@@ -1900,11 +2118,9 @@ impl<'a> PatternExecutor<'a> {
                     };
 
                     // Global dedup — skip if already visited at any depth
-                    let target_idx = target.index();
-                    if visited[target_idx] {
+                    if !visited.insert(target.index()) {
                         continue;
                     }
-                    visited[target_idx] = true;
 
                     let new_depth = depth + 1;
 
@@ -1941,6 +2157,58 @@ impl<'a> PatternExecutor<'a> {
         Ok(results)
     }
 
+    /// The typed CSR an expansion of `edge_pattern` may walk. The CSR lays
+    /// peers out in edge-index order, so only an order-insensitive consumer
+    /// may walk it, and a per-source expansion cannot amortise a build: use
+    /// it only if one is already cached.
+    fn cached_unordered_adjacency(
+        &self,
+        edge_pattern: &EdgePattern,
+        conn_key: Option<InternedKey>,
+    ) -> Option<Arc<MemoryTypedAdjacency>> {
+        match conn_key {
+            Some(key) if edge_pattern.targets_unordered && edge_pattern.properties.is_none() => {
+                self.graph.graph.existing_typed_adjacency(key)
+            }
+            _ => None,
+        }
+    }
+
+    /// Push every target `walk` reaches from `source` that matches
+    /// `node_pattern`, one hop level at a time. Order follows the level BFS,
+    /// not edge order, so only an order-insensitive consumer may use it.
+    fn push_hop_level_targets(
+        &self,
+        walk: &HopWalk<'_>,
+        source: NodeIndex,
+        edge_pattern: &EdgePattern,
+        node_pattern: &NodePattern,
+        results: &mut Vec<(NodeIndex, MatchBinding)>,
+    ) -> Result<(), String> {
+        super::reach::for_each_hop_level(walk, |hops, nodes| {
+            for &node in nodes {
+                let target = walk.adjacency.node_index(node);
+                let node_matches = edge_pattern.skip_target_type_check
+                    || self.node_matches_pattern_labels(target, node_pattern);
+                let props_match = match node_pattern.properties {
+                    Some(ref props) => self.node_matches_properties(target, props),
+                    None => true,
+                };
+                if node_matches && props_match {
+                    results.push((
+                        target,
+                        MatchBinding::VariableLengthPath {
+                            source,
+                            target,
+                            hops,
+                            path: Vec::new(),
+                        },
+                    ));
+                }
+            }
+        })
+    }
+
     /// Expand via variable-length path (BFS within hop range)
     /// Optimized: Only clones paths when branching (multiple valid targets from same node)
     fn expand_var_length(
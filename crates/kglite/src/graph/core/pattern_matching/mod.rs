@@ -1,9 +1,11 @@
 //! Pattern matching — parse and match Cypher-style patterns against a DirGraph.
 //!
-//! Split into three submodules:
+//! Split into these submodules:
 //! - [`pattern`] — AST types (Pattern, NodePattern, EdgePattern, PropertyMatcher, etc.)
 //! - [`parser`] — tokenizer + Parser that turns pattern strings into the AST
 //! - [`matcher`] — PatternExecutor state machine that runs matches against a graph
+//! - `reach` — direction-optimizing hop-level BFS over the heap CSR adjacency,
+//!   used by the matcher when target order is unobservable
 //!
 //! The PropertyMatcher enum is defined in `pattern` with its cases, its
 //! construction in the Parser, and its evaluation in `matcher::PatternExecutor`.
@@ -13,6 +15,7 @@
 pub mod matcher;
 pub mod parser;
 pub mod pattern;
+mod reach;
 
 pub use matcher::PatternExecutor;
 pub use parser::parse_pattern;
@@ -454,6 +454,7 @@ impl Parser {
                 properties: None,
                 var_length: None,
                 needs_path_info: true,
+                targets_unordered: false,
                 skip_target_type_check: false,
                 edge_filter: None,
             });
@@ -560,6 +561,7 @@ impl Parser {
             properties,
             var_length,
             needs_path_info: true,
+            targets_unordered: false,
             skip_target_type_check: false,
             edge_filter: None,
         })
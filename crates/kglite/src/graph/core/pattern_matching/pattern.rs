@@ -66,6 +66,11 @@ pub struct EdgePattern {
     /// expansion omits its exact-trail allocation. Set false only when the
     /// planner proves the surrounding query does not consume path identity.
     pub needs_path_info: bool,
+    /// Whether a fast variable-length expansion may emit its targets in any
+    /// order. Lets the matcher use direction-optimizing BFS, whose bottom-up
+    /// levels come out in node-index order. Set true only when the planner
+    /// proves the surrounding query cannot observe row order.
+    pub targets_unordered: bool,
     /// When true, the connection type metadata guarantees the target node
     /// matches the pattern's type, so the node_weight() lookup can be skipped.
     /// Set by the query planner when connection_type_metadata confirms a single
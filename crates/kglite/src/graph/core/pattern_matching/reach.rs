@@ -0,0 +1,480 @@
+// Reach — level-synchronous variable-length BFS over the heap backend's
+// per-type CSR adjacency, for callers that only consume the set of nodes
+// reached at each depth (not an ordered row stream).
+//
+// Uses Beamer's direction-optimizing BFS: expand top-down (frontier →
+// neighbours) while the frontier is small, and switch to bottom-up (every
+// unvisited node scans its reverse neighbours for a frontier member, stopping
+// at the first hit) once the frontier's edges outweigh the unexplored ones.
+// On scale-free graphs the frontier swallows most of the graph within a few
+// hops of a hub, and a bottom-up sweep is then one linear pass over the CSR
+// instead of re-touching every edge out of a huge frontier.
+//
+// Walks run in the adjacency's local id space (see `MemoryTypedAdjacency`),
+// which spans only nodes with an edge of the walked type, so a bottom-up
+// sweep costs the typed subgraph, not the whole graph.
+//
+// Bottom-up levels discover nodes in index order rather than BFS order, so
+// this is only used where the planner has proven row order is unobservable.
+
+use crate::graph::algorithms::Interrupt;
+use crate::graph::mutation::subgraph_streaming::Bitset;
+use crate::graph::storage::MemoryTypedAdjacency;
+use petgraph::Direction;
+use rayon::prelude::*;
+use std::time::Instant;
+
+/// Top-down → bottom-up once the frontier's edges exceed `1/ALPHA` of the
+/// edges still attached to unvisited nodes. Beamer et al.'s tuned default.
+const ALPHA: usize = 14;
+
+/// Bottom-up → top-down once the frontier shrinks below `1/BETA` of the
+/// node range. Beamer et al.'s tuned default.
+const BETA: usize = 24;
+
+/// Poll the interrupt once per this many units of work (nodes visited plus
+/// adjacency entries scanned), so the clock read stays off the per-edge path
+/// while a timeout still lands within about a millisecond of scanning. A
+/// node-count cadence would let a single hub level run unchecked.
+const POLL_WORK: usize = 1 << 20;
+
+/// One variable-length walk over a typed adjacency: where it starts (a
+/// local id of `adjacency`), which way and how deep it goes, and the
+/// interrupt that can stop it. `Copy`, so per-seed walks are
+/// `HopWalk { seed, ..base }`.
+#[derive(Clone, Copy)]
+pub(crate) struct HopWalk<'a> {
+    pub(crate) adjacency: &'a MemoryTypedAdjacency,
+    pub(crate) directions: &'a [Direction],
+    pub(crate) seed: u32,
+    pub(crate) min_hops: usize,
+    pub(crate) max_hops: usize,
+    pub(crate) interrupt: Interrupt,
+}
+
+/// Visit every node within `min_hops..=max_hops` hops of `seed`, calling
+/// `on_level(depth, nodes)` once per depth with the local ids whose shortest
+/// distance from `seed` is exactly `depth`. The seed itself (depth 0) is
+/// never reported — callers handle the zero-hop case against their own
+/// node filters. Results are identical to the edge-walking fast BFS in
+/// [`super::PatternExecutor`]; only the order within a level differs.
+pub(crate) fn for_each_hop_level<F>(walk: &HopWalk<'_>, on_level: F) -> Result<(), String>
+where
+    F: FnMut(usize, &[u32]),
+{
+    hop_levels(walk, ALPHA, BETA, on_level)?;
+    Ok(())
+}
+
+/// Every node within `1..=max_hops` hops of `seed`, as a bitset over the
+/// adjacency's local ids — the union of [`for_each_hop_level`]'s levels for
+/// `min_hops = 1`, handed back as the BFS visited set instead of node by
+/// node. The seed's own bit is clear, and `walk.min_hops` is not consulted.
+pub(crate) fn reach_within(walk: &HopWalk<'_>) -> Result<Bitset, String> {
+    let from_first_hop = HopWalk {
+        min_hops: 1,
+        ..*walk
+    };
+    let mut visited = hop_levels(&from_first_hop, ALPHA, BETA, |_, _| {})?;
+    visited.unset(walk.seed as usize);
+    Ok(visited)
+}
+
+/// Union of every seed's contribution over `0..len`, where `add_seed` ORs
+/// one seed's reach into the bitset it is handed. Seeds are
+/// independent, so with `parallel` each runs on its own rayon thread into a
+/// private bitset and the bitsets are OR-ed; otherwise one bitset
+/// accumulates them in turn. Either way the interrupt is polled before
+/// every seed.
+pub(crate) fn union_seed_reaches<S, F>(
+    seeds: Vec<S>,
+    len: usize,
+    parallel: bool,
+    interrupt: Interrupt,
+    add_seed: F,
+) -> Result<Bitset, String>
+where
+    S: Send,
+    F: Fn(&mut Bitset, S) -> Result<(), String> + Sync,
+{
+    if !parallel {
+        let mut reached = Bitset::with_len(len);
+        for seed in seeds {
+            check_interrupt(&interrupt)?;
+            add_seed(&mut reached, seed)?;
+        }
+        return Ok(reached);
+    }
+    seeds
+        .into_par_iter()
+        .map(|seed| {
+            check_interrupt(&interrupt)?;
+            let mut own = Bitset::with_len(len);
+            add_seed(&mut own, seed)?;
+            Ok(own)
+        })
+        .try_reduce(
+            || Bitset::with_len(len),
+            |mut acc, own| {
+                acc.union_with(&own);
+                Ok(acc)
+            },
+        )
+}
+
+/// `Err` with the matcher's message once `interrupt` has fired.
+fn check_interrupt(interrupt: &Interrupt) -> Result<(), String> {
+    if !interrupt.exceeded() {
+        return Ok(());
+    }
+    if interrupt.deadline.is_some_and(|dl| Instant::now() > dl) {
+        return Err("Query timed out".to_string());
+    }
+    Err("Query cancelled".to_string())
+}
+
+fn hop_levels<F>(
+    walk: &HopWalk<'_>,
+    alpha: usize,
+    beta: usize,
+    mut on_level: F,
+) -> Result<Bitset, String>
+where
+    F: FnMut(usize, &[u32]),
+{
+    let HopWalk {
+        adjacency,
+        directions,
+        seed,
+        min_hops,
+        max_hops,
+        interrupt,
+    } = *walk;
+    let node_count = adjacency.node_count();
+    let degree = |node: u32| -> usize {
+        directions
+            .iter()
+            .map(|&dir| adjacency.neighbors(node as usize, dir).len())
+            .sum()
+    };
+
+    let mut visited = Bitset::with_len(node_count);
+    visited.set(seed as usize);
+
+    let mut frontier: Vec<u32> = vec![seed];
+    // Edges out of the frontier vs. edges out of still-unvisited nodes.
+    let mut frontier_edges = degree(seed);
+    let mut unexplored_edges: usize = directions
+        .iter()
+        .map(|&dir| match dir {
+            Direction::Outgoing => adjacency.out_targets.len(),
+            Direction::Incoming => adjacency.in_sources.len(),
+        })
+        .sum::<usize>()
+        .saturating_sub(frontier_edges);
+    let mut bottom_up = false;
+    // Work since the last interrupt poll; see `POLL_WORK`.
+    let mut work: usize = 0;
+    let mut poll = |scanned: usize| -> Result<(), String> {
+        work += 1 + scanned;
+        if work < POLL_WORK {
+            return Ok(());
+        }
+        work = 0;
+        check_interrupt(&interrupt)
+    };
+
+    // An empty frontier already ends the walk once the reached set stops
+    // growing. When every node is visited the walk can also stop, rather
+    // than run one more level that sweeps the graph and finds nothing.
+    let mut n_visited = 1;
+    let mut depth = 0;
+    while !frontier.is_empty() && depth < max_hops && n_visited < node_count {
+        depth += 1;
+        if !bottom_up && frontier_edges > unexplored_edges / alpha {
+            bottom_up = true;
+        } else if bottom_up && frontier.len() < node_count / beta {
+            bottom_up = false;
+        }
+
+        let mut next: Vec<u32> = Vec::new();
+        if bottom_up {
+            let mut in_frontier = Bitset::with_len(node_count);
+            for &node in &frontier {
+                in_frontier.set(node as usize);
+            }
+            for node in 0..node_count {
+                if visited.get(node) {
+                    poll(0)?;
+                    continue;
+                }
+                // An edge u → node reaches node from u, so look at node's
+                // peers in the opposite direction.
+                let mut scanned = 0;
+                let found = directions.iter().any(|&dir| {
+                    let peers = adjacency.neighbors(node, dir.opposite());
+                    scanned += peers.len();
+                    peers.iter().any(|&peer| in_frontier.get(peer as usize))
+                });
+                poll(scanned)?;
+                if found {
+                    visited.set(node);
+                    next.push(node as u32);
+                }
+            }
+        } else {
+            for &node in &frontier {
+                let mut scanned = 0;
+                for &dir in directions {
+                    let peers = adjacency.neighbors(node as usize, dir);
+                    scanned += peers.len();
+                    for &peer in peers {
+                        if visited.insert(peer as usize) {
+                            next.push(peer);
+                        }
+                    }
+                }
+                poll(scanned)?;
+            }
+        }
+
+        n_visited += next.len();
+        frontier_edges = next.iter().map(|&node| degree(node)).sum();
+        unexplored_edges = unexplored_edges.saturating_sub(frontier_edges);
+        if depth >= min_hops && !next.is_empty() {
+            on_level(depth, &next);
+        }
+        frontier = next;
+    }
+    Ok(visited)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use petgraph::graph::NodeIndex;
+    use std::collections::VecDeque;
+    use std::sync::atomic::AtomicBool;
+
+    /// CSR over local ids `0..n` from an edge list, in insertion order.
+    fn adjacency(n: usize, edges: &[(u32, u32)]) -> MemoryTypedAdjacency {
+        let flatten = |key: fn(&(u32, u32)) -> (u32, u32)| {
+            let mut offsets = vec![0u32; n + 1];
+            let mut peers = Vec::new();
+            for node in 0..n as u32 {
+                peers.extend(edges.iter().map(key).filter(|e| e.0 == node).map(|e| e.1));
+                offsets[node as usize + 1] = peers.len() as u32;
+            }
+            (offsets, peers)
+        };
+        let (out_offsets, out_targets) = flatten(|&(s, t)| (s, t));
+        let (in_offsets, in_sources) = flatten(|&(s, t)| (t, s));
+        MemoryTypedAdjacency {
+            nodes: (0..n as u32).collect(),
+            out_offsets,
+            out_targets,
+            in_offsets,
+            in_sources,
+        }
+    }
+
+    /// Plain queue BFS: shortest hop count per node, `None` = unreached.
+    fn distances(
+        adj: &MemoryTypedAdjacency,
+        dirs: &[Direction],
+        seed: usize,
+    ) -> Vec<Option<usize>> {
+        let n = adj.out_offsets.len() - 1;
+        let mut dist = vec![None; n];
+        dist[seed] = Some(0);
+        let mut queue = VecDeque::from([seed]);
+        while let Some(node) = queue.pop_front() {
+            for &dir in dirs {
+                for &peer in adj.neighbors(node, dir) {
+                    if dist[peer as usize].is_none() {
+                        dist[peer as usize] = Some(dist[node].unwrap() + 1);
+                        queue.push_back(peer as usize);
+                    }
+                }
+            }
+        }
+        dist
+    }
+
+    /// Uninterrupted outgoing walk of `1..=max_hops` from `seed`.
+    fn outgoing(adj: &MemoryTypedAdjacency, seed: usize, max_hops: usize) -> HopWalk<'_> {
+        HopWalk {
+            adjacency: adj,
+            directions: &[Direction::Outgoing],
+            seed: seed as u32,
+            min_hops: 1,
+            max_hops,
+            interrupt: Interrupt::default(),
+        }
+    }
+
+    /// Hub-and-chain graph: node 0 fans out to everything, then a chain.
+    fn hub_graph(n: u32) -> Vec<(u32, u32)> {
+        let mut edges: Vec<(u32, u32)> = (1..n).map(|t| (0, t)).collect();
+        edges.extend((1..n - 1).map(|s| (s, s + 1)));
+        edges.push((n - 1, 0));
+        edges.extend([(7, 3), (9, 2), (5, 11)]);
+        edges
+    }
+
+    #[test]
+    fn levels_match_queue_bfs_in_every_mode() {
+        let n = 40usize;
+        let adj = adjacency(n, &hub_graph(n as u32));
+        let both = [Direction::Outgoing, Direction::Incoming];
+        let cases: [&[Direction]; 3] = [&[Direction::Outgoing], &[Direction::Incoming], &both];
+        // (alpha, beta): default heuristic, eager switch back to top-down,
+        // and bottom-up from the second level on.
+        let modes = [(ALPHA, BETA), (1, 1), (usize::MAX, usize::MAX)];
+        for dirs in cases {
+            for seed in [0usize, 3, 17] {
+                let dist = distances(&adj, dirs, seed);
+                for (alpha, beta) in modes {
+                    for (min_hops, max_hops) in [(1, 1), (1, 3), (2, 5), (0, 40)] {
+                        let mut got = vec![None; n];
+                        let walk = HopWalk {
+                            adjacency: &adj,
+                            directions: dirs,
+                            seed: seed as u32,
+                            min_hops,
+                            max_hops,
+                            interrupt: Interrupt::default(),
+                        };
+                        hop_levels(&walk, alpha, beta, |depth, nodes| {
+                            for &node in nodes {
+                                assert!(got[node as usize].is_none(), "reported twice");
+                                got[node as usize] = Some(depth);
+                            }
+                        })
+                        .unwrap();
+                        let want: Vec<Option<usize>> = dist
+                            .iter()
+                            .map(|d| d.filter(|&d| d >= min_hops.max(1) && d <= max_hops))
+                            .collect();
+                        assert_eq!(got, want, "dirs={dirs:?} seed={seed} mode=({alpha},{beta})");
+                    }
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn bottom_up_levels_stay_inside_a_sparse_typed_subgraph() {
+        // 40 typed nodes scattered over a million-node range: the CSR and
+        // every bottom-up sweep span the 40 local ids, not the range.
+        let n = 40u32;
+        let spread = |node: u32| node * 25_000 + 3;
+        let edges: Vec<(u32, u32)> = hub_graph(n)
+            .into_iter()
+            .map(|(s, t)| (spread(s), spread(t)))
+            .collect();
+        let sparse = MemoryTypedAdjacency::from_edges(&edges);
+        assert_eq!(sparse.node_count(), n as usize);
+
+        let dense = adjacency(n as usize, &hub_graph(n));
+        for seed in [0u32, 3, 17] {
+            let dist = distances(&dense, &[Direction::Outgoing], seed as usize);
+            let local = sparse
+                .local_id(NodeIndex::new(spread(seed) as usize))
+                .unwrap();
+            let mut got = vec![None; n as usize];
+            hop_levels(
+                &outgoing(&sparse, local as usize, 5),
+                usize::MAX,
+                usize::MAX,
+                |depth, nodes| {
+                    for &node in nodes {
+                        let graph_id = sparse.node_index(node).index() as u32;
+                        got[((graph_id - 3) / 25_000) as usize] = Some(depth);
+                    }
+                },
+            )
+            .unwrap();
+            let want: Vec<Option<usize>> = dist
+                .iter()
+                .map(|d| d.filter(|&d| (1..=5).contains(&d)))
+                .collect();
+            assert_eq!(got, want, "seed={seed}");
+        }
+    }
+
+    #[test]
+    fn reach_within_is_the_union_of_levels() {
+        let n = 40usize;
+        let adj = adjacency(n, &hub_graph(n as u32));
+        for seed in [0usize, 3, 17] {
+            let dist = distances(&adj, &[Direction::Outgoing], seed);
+            for max_hops in [0, 1, 3, 40] {
+                let got = reach_within(&outgoing(&adj, seed, max_hops)).unwrap();
+                for (node, d) in dist.iter().enumerate() {
+                    let want = d.is_some_and(|d| (1..=max_hops).contains(&d));
+                    assert_eq!(
+                        got.get(node),
+                        want,
+                        "seed={seed} max={max_hops} node={node}"
+                    );
+                }
+            }
+        }
+    }
+
+    #[test]
+    fn long_walks_poll_the_interrupt() {
+        static CANCEL: AtomicBool = AtomicBool::new(true);
+        // A chain long enough to cross `POLL_WORK` within one traversal.
+        let n = POLL_WORK as u32;
+        let adj = MemoryTypedAdjacency {
+            nodes: (0..n).collect(),
+            out_offsets: (0..n).chain([n - 1]).collect(),
+            out_targets: (1..n).collect(),
+            in_offsets: [0].into_iter().chain(0..n).collect(),
+            in_sources: (0..n - 1).collect(),
+        };
+        let base = outgoing(&adj, 0, n as usize);
+        let walk = |interrupt| reach_within(&HopWalk { interrupt, ..base });
+        let cancelled = Interrupt {
+            deadline: None,
+            cancel: Some(&CANCEL),
+        };
+        assert_eq!(walk(cancelled).err().as_deref(), Some("Query cancelled"));
+        let expired = Interrupt::from_deadline(Some(Instant::now()));
+        assert_eq!(walk(expired).err().as_deref(), Some("Query timed out"));
+        assert_eq!(
+            walk(Interrupt::default()).unwrap().count_ones(),
+            u64::from(n) - 1
+        );
+    }
+
+    #[test]
+    fn parallel_seed_union_matches_serial() {
+        let n = 40usize;
+        let adj = adjacency(n, &hub_graph(n as u32));
+        let seeds: Vec<usize> = (1..n).step_by(3).collect();
+        let add_seed = |reached: &mut Bitset, seed: usize| -> Result<(), String> {
+            reached.union_with(&reach_within(&outgoing(&adj, seed, 2))?);
+            Ok(())
+        };
+        let union = |parallel, interrupt| {
+            union_seed_reaches(seeds.clone(), n, parallel, interrupt, add_seed)
+        };
+        let serial = union(false, Interrupt::default()).unwrap();
+        let parallel = union(true, Interrupt::default()).unwrap();
+        assert!(serial.count_ones() > 0);
+        assert_eq!(parallel.count_ones(), serial.count_ones());
+        assert!((0..n).all(|node| parallel.get(node) == serial.get(node)));
+
+        let expired = Interrupt::from_deadline(Some(Instant::now()));
+        for parallel in [false, true] {
+            assert_eq!(
+                union(parallel, expired).err().as_deref(),
+                Some("Query timed out"),
+                "parallel={parallel}"
+            );
+        }
+    }
+}
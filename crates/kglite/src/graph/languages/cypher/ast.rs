@@ -235,6 +235,19 @@ pub enum Clause {
         edge_type: Option<String>,
         alias: String,
     },
+    /// Optimizer-generated: MATCH (a)-[:T*min..max]->(b) [WHERE <a only>]
+    /// RETURN count(DISTINCT b) → one bitset of reached targets unioned across
+    /// every seed, walked over the per-type CSR adjacency without
+    /// materializing a row per target. The original clauses are kept so
+    /// backends without a typed adjacency (mapped / disk) run them unchanged.
+    FusedVarLengthDistinctCount {
+        match_clause: MatchClause,
+        /// Residual / safety-net WHERE; references only the seed variable,
+        /// so it is evaluated once per seed.
+        where_predicate: Option<Predicate>,
+        return_clause: ReturnClause,
+        alias: String,
+    },
     /// Optimizer-generated: MATCH (n:Type) [WHERE ...] RETURN group_keys, agg_funcs(...)
     /// → single-pass node scan with inline aggregation. Avoids materializing intermediate
     /// ResultRows — evaluates group keys and aggregates directly from node properties.
@@ -241,6 +241,18 @@ pub fn clause_display_name(clause: &Clause) -> String {
             let t = edge_type.as_deref().unwrap_or("*");
             format!("FusedCountAnchoredEdges (anchor#{anchor_idx} {arrow} :{t})")
         }
+        Clause::FusedVarLengthDistinctCount { match_clause, .. } => {
+            let t = match_clause
+                .patterns
+                .first()
+                .and_then(|p| p.elements.get(1))
+                .and_then(|e| match e {
+                    PatternElement::Edge(ep) => ep.connection_type.as_deref(),
+                    PatternElement::Node(_) => None,
+                })
+                .unwrap_or("*");
+            format!("FusedVarLengthDistinctCount :{t}")
+        }
         Clause::FusedNodeScanAggregate { .. } => "FusedNodeScanAggregate".into(),
         Clause::FusedNodeScanTopK { limit, .. } => format!("FusedNodeScanTopK (k={limit})"),
         Clause::SpatialJoin {
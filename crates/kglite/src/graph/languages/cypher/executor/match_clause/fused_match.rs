@@ -1237,6 +1237,55 @@ impl<'a> CypherExecutor<'a> {
             .find_matching_nodes_pub(node_pattern)
     }
 
+    /// Fused MATCH (a)-[:T*lo..hi]->(b) [WHERE <a only>] RETURN count(DISTINCT b).
+    /// Unions every kept seed's reach into one bitset and counts it; a
+    /// backend without typed adjacency runs the absorbed clauses instead.
+    pub(super) fn execute_fused_var_length_distinct_count(
+        &self,
+        match_clause: &MatchClause,
+        where_predicate: Option<&Predicate>,
+        return_clause: &ReturnClause,
+        alias: &str,
+        result_set: ResultSet,
+    ) -> Result<ResultSet, String> {
+        let pattern = &match_clause.patterns[0];
+        let seed_var = match pattern.elements.first() {
+            Some(PatternElement::Node(np)) => np.variable.as_deref(),
+            _ => None,
+        };
+        // WHERE reads only the seed variable (planner-checked), so a single
+        // reusable row with that one binding evaluates it.
+        let folded_where = where_predicate.map(|p| self.fold_constants_pred(p));
+        let mut eval_row = ResultRow::new();
+        if let Some(var) = seed_var {
+            eval_row
+                .node_bindings
+                .insert(var.to_string(), NodeIndex::new(0));
+        }
+        let keep_seed = |seed: NodeIndex| {
+            let Some(ref pred) = folded_where else {
+                return Ok(true);
+            };
+            if let Some(slot) = seed_var.and_then(|v| eval_row.node_bindings.get_mut(v)) {
+                *slot = seed;
+            }
+            self.evaluate_predicate(pred, &eval_row)
+        };
+        let executor = PatternExecutor::new_lightweight_with_params(self.graph, None, self.params)
+            .set_deadline(self.deadline)
+            .set_cancel(self.cancel);
+        let Some(count) = executor.count_distinct_var_length_targets(pattern, keep_seed)? else {
+            // No typed adjacency on this backend — run the clauses the
+            // fusion absorbed, with the WHERE inlined into the MATCH as the
+            // unfused plan would.
+            let rows = self.execute_match(match_clause, result_set, where_predicate)?;
+            return self.execute_return(return_clause, rows);
+        };
+        self.budget
+            .check_work(count, "fused var-length distinct count")?;
+        Ok(single_count_result(alias, count as i64))
+    }
+
     /// Fused MATCH (n:Type) [WHERE ...] RETURN group_keys, agg_funcs(...)
     /// Single-pass node scan: iterates nodes directly, evaluates group keys
     /// and aggregates without creating intermediate ResultRows.
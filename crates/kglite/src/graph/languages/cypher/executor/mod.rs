@@ -111,6 +111,17 @@ pub struct CypherExecutor<'a> {
     _arena_guard: Option<crate::graph::storage::disk::graph::DiskQueryGuard>,
 }
 
+/// The single `alias = count` row a fused count clause returns.
+fn single_count_result(alias: &str, count: i64) -> ResultSet {
+    let mut projected = Bindings::with_capacity(1);
+    projected.insert(alias.to_string(), Value::Int64(count));
+    ResultSet {
+        rows: vec![ResultRow::from_projected(projected)],
+        columns: vec![alias.to_string()],
+        lazy_return_items: None,
+    }
+}
+
 impl<'a> CypherExecutor<'a> {
     pub fn with_params(
         graph: &'a DirGraph,
@@ -669,26 +680,14 @@ impl<'a> CypherExecutor<'a> {
                 self.budget
                     .check_work(self.graph.graph.node_count(), "fused node count")?;
                 let count = self.graph.graph.node_count() as i64;
-                let mut projected = Bindings::with_capacity(1);
-                projected.insert(alias.clone(), Value::Int64(count));
-                Ok(ResultSet {
-                    rows: vec![ResultRow::from_projected(projected)],
-                    columns: vec![alias.clone()],
-                    lazy_return_items: None,
-                })
+                Ok(single_count_result(alias, count))
             }
             Clause::FusedCountAllEdges { alias } => {
                 let edge_count = self.graph.graph.edge_count();
                 self.budget.check_work(edge_count, "fused all-edge count")?;
                 let count = i64::try_from(edge_count)
                     .map_err(|_| "edge count exceeds Cypher integer range".to_string())?;
-                let mut projected = Bindings::with_capacity(1);
-                projected.insert(alias.clone(), Value::Int64(count));
-                Ok(ResultSet {
-                    rows: vec![ResultRow::from_projected(projected)],
-                    columns: vec![alias.clone()],
-                    lazy_return_items: None,
-                })
+                Ok(single_count_result(alias, count))
             }
             Clause::FusedCountByType {
                 type_alias,
@@ -741,13 +740,7 @@ impl<'a> CypherExecutor<'a> {
                 let count = (primary + secondary) as i64;
                 self.budget
                     .check_work(count as usize, "fused typed node count")?;
-                let mut projected = Bindings::with_capacity(1);
-                projected.insert(alias.clone(), Value::Int64(count));
-                Ok(ResultSet {
-                    rows: vec![ResultRow::from_projected(projected)],
-                    columns: vec![alias.clone()],
-                    lazy_return_items: None,
-                })
+                Ok(single_count_result(alias, count))
             }
             Clause::FusedCountTypedEdge { edge_type, alias } => {
                 // Use the cached edge-type count. Populated by the N-Triples
@@ -759,13 +752,7 @@ impl<'a> CypherExecutor<'a> {
                 let count = counts.get(edge_type).copied().unwrap_or(0) as i64;
                 self.budget
                     .check_work(count as usize, "fused typed edge count")?;
-                let mut projected = Bindings::with_capacity(1);
-                projected.insert(alias.clone(), Value::Int64(count));
-                Ok(ResultSet {
-                    rows: vec![ResultRow::from_projected(projected)],
-                    columns: vec![alias.clone()],
-                    lazy_return_items: None,
-                })
+                Ok(single_count_result(alias, count))
             }
             Clause::FusedCountAnchoredEdges {
                 anchor_idx,
@@ -788,14 +775,20 @@ impl<'a> CypherExecutor<'a> {
                 )? as i64;
                 self.budget
                     .check_work(count as usize, "fused anchored edge count")?;
-                let mut projected = Bindings::with_capacity(1);
-                projected.insert(alias.clone(), Value::Int64(count));
-                Ok(ResultSet {
-                    rows: vec![ResultRow::from_projected(projected)],
-                    columns: vec![alias.clone()],
-                    lazy_return_items: None,
-                })
+                Ok(single_count_result(alias, count))
             }
+            Clause::FusedVarLengthDistinctCount {
+                match_clause,
+                where_predicate,
+                return_clause,
+                alias,
+            } => self.execute_fused_var_length_distinct_count(
+                match_clause,
+                where_predicate.as_ref(),
+                return_clause,
+                alias,
+                result_set,
+            ),
             Clause::FusedNodeScanAggregate {
                 match_clause,
                 where_predicate,
@@ -126,7 +126,8 @@ pub fn generate_explain_result(query: &CypherQuery, graph: &DirGraph) -> result:
             | Clause::FusedMatchReturnAggregate { .. }
             | Clause::FusedOptionalMatchAggregate { .. }
             | Clause::FusedCountTypedEdge { .. }
-            | Clause::FusedCountAnchoredEdges { .. } => Value::Int64(1),
+            | Clause::FusedCountAnchoredEdges { .. }
+            | Clause::FusedVarLengthDistinctCount { .. } => Value::Int64(1),
             Clause::FusedCountTypedNode { node_type, .. } => {
                 let n = graph
                     .type_indices
@@ -26,6 +26,17 @@
 //! parameter binding happens later at execute time. text_score queries inject
 //! per-call embedding params, so they're never inserted (the insert is gated
 //! on the post-prepare param map staying empty) and therefore never hit.
+//!
+//! ## Why there is no shape-keyed (literal-stripped) plan cache
+//!
+//! Keying plans by a fingerprint with literals and `$params` stripped would
+//! let `WHERE n.id IN $seeds` reuse one plan across seed lists, but it is not
+//! sound here: `push_where_into_match`, index selection and relationship
+//! predicate pushdown fold parameter *values* into the plan (an `IN` list
+//! becomes the pattern's id matcher). Hot fixed-shape queries are served by
+//! fused operators instead — e.g. `FusedVarLengthDistinctCount` for
+//! `(a)-[:T*lo..hi]->(b) RETURN count(DISTINCT b)` — whose per-call planning
+//! cost is small next to execution, so they gain little from a plan hit.
 
 use super::CypherQuery;
 use std::collections::{HashMap, VecDeque};
@@ -10,11 +10,14 @@ use std::collections::HashSet;
 /// the downstream RETURN/WITH is `DISTINCT` or composed of dedup-safe
 /// aggregates (`min/max/count(DISTINCT)/collect(DISTINCT)`), mark
 /// `needs_path_info=false` so the executor uses a fast BFS with
-/// global target-node dedup. The downstream-safety check is critical:
+/// global target-node dedup. When every item is `count(DISTINCT _)`,
+/// which alone hides row order, mark `targets_unordered=true` so the
+/// BFS may run direction-optimizing. The downstream-safety check is critical:
 /// row count is implicit path count, so dedup-by-target silently
 /// drops rows when the user wrote a plain per-path projection like
-/// `RETURN q.name`. WHY-BAIL: anything else stays on the slow per-
-/// path BFS — correct, just not as fast.
+/// `RETURN q.name`. WHY-BAIL: anything else, and every MATCH past the
+/// first RETURN/WITH, stays on the slow per-path BFS — correct, just
+/// not as fast.
 pub(super) fn pass_mark_fast_var_length_paths(query: &mut CypherQuery, _ctx: &PassCtx) {
     mark_fast_var_length_paths(query)
 }
@@ -61,9 +64,13 @@ fn mark_fast_var_length_paths(query: &mut CypherQuery) {
     if !downstream_is_dedup_safe(query) {
         return;
     }
+    let unordered = downstream_is_order_insensitive(query);
     for clause in &mut query.clauses {
         let mc = match clause {
             Clause::Match(mc) | Clause::OptionalMatch(mc) => mc,
+            // Both checks judge the first projection only; a MATCH past it
+            // feeds a later projection that may count every path.
+            Clause::Return(_) | Clause::With(_) => break,
             _ => continue,
         };
 
@@ -77,6 +84,7 @@ fn mark_fast_var_length_paths(query: &mut CypherQuery) {
                 if let PatternElement::Edge(ep) = element {
                     if ep.var_length.is_some() && ep.variable.is_none() {
                         ep.needs_path_info = false;
+                        ep.targets_unordered = unordered;
                     }
                 }
             }
@@ -188,6 +196,32 @@ fn downstream_is_dedup_safe(query: &CypherQuery) -> bool {
     false
 }
 
+/// Returns true iff the query's first downstream projection also hides
+/// row *order*: every item is `count(DISTINCT _)`. Lets the fast
+/// var-length BFS run direction-optimizing, which emits bottom-up levels
+/// in node-index order. `min`/`max` don't qualify: ties between values
+/// that compare equal (`1` and `1.0`) or don't compare at all (mixed
+/// types, NaN) keep the first one seen. `DISTINCT` projections and
+/// `collect(DISTINCT _)` keep first-seen order too.
+fn downstream_is_order_insensitive(query: &CypherQuery) -> bool {
+    for clause in &query.clauses {
+        let items = match clause {
+            Clause::Return(r) => &r.items,
+            Clause::With(w) => &w.items,
+            _ => continue,
+        };
+        return !items.is_empty()
+            && items.iter().all(|item| {
+                matches!(
+                    &item.expression,
+                    Expression::FunctionCall { name, distinct: true, .. }
+                        if name.eq_ignore_ascii_case("count")
+                )
+            });
+    }
+    false
+}
+
 /// True when an expression is an aggregate that's invariant to row
 /// multiplicity: `count(DISTINCT _)`, `min/max(_)`, `collect(DISTINCT _)`.
 /// Plain `count(_)` and `sum(_)` would shift with row count, so they
@@ -282,8 +316,11 @@ fn mark_skip_target_type_check(query: &mut CypherQuery, graph: &DirGraph) {
 
 #[cfg(test)]
 mod tests {
-    use super::fixed_edge_types_are_pairwise_disjoint;
+    use super::{
+        fixed_edge_types_are_pairwise_disjoint, mark_fast_var_length_paths, Clause, PatternElement,
+    };
     use crate::graph::core::pattern_matching::parse_pattern;
+    use crate::graph::languages::cypher::parser::parse_cypher;
 
     #[test]
     fn disjoint_fixed_edge_types_need_no_trail() {
@@ -306,4 +343,29 @@ mod tests {
             assert!(!fixed_edge_types_are_pairwise_disjoint(&pattern), "{text}");
         }
     }
+
+    #[test]
+    fn only_matches_before_the_first_projection_drop_path_info() {
+        let mut query = parse_cypher(
+            "MATCH (a)-[:T*1..3]->(b) WITH count(DISTINCT b) AS c \
+             MATCH (x)-[:T*1..3]->(y) RETURN c, y.name",
+        )
+        .unwrap();
+        mark_fast_var_length_paths(&mut query);
+
+        let var_length_edges: Vec<(bool, bool)> = query
+            .clauses
+            .iter()
+            .filter_map(|clause| match clause {
+                Clause::Match(mc) => Some(mc),
+                _ => None,
+            })
+            .flat_map(|mc| &mc.patterns[0].elements)
+            .filter_map(|element| match element {
+                PatternElement::Edge(ep) => Some((ep.needs_path_info, ep.targets_unordered)),
+                _ => None,
+            })
+            .collect();
+        assert_eq!(var_length_edges, [(false, true), (true, false)]);
+    }
 }
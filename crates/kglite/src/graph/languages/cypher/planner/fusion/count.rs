@@ -7,6 +7,7 @@ use super::*;
 use crate::datatypes::values::Value;
 use crate::graph::core::pattern_matching::PatternElement;
 use crate::graph::languages::cypher::ast::*;
+use crate::graph::languages::cypher::planner::PassCtx;
 use crate::graph::schema::DirGraph;
 
 pub(crate) fn fuse_anchored_edge_count(query: &mut CypherQuery, graph: &DirGraph) {
@@ -151,6 +152,88 @@ pub(crate) fn fuse_anchored_edge_count(query: &mut CypherQuery, graph: &DirGraph
     );
 }
 
+/// **Pass:** `fuse_var_length_distinct_count` — `MATCH (a)-[:T*min..max]->(b)
+/// [WHERE ...] RETURN count(DISTINCT b)` → `FusedVarLengthDistinctCount`,
+/// which unions each seed's BFS into one reached-node bitset and counts it,
+/// instead of emitting a row per (seed, target) and deduplicating in the
+/// aggregator. Runs after the `mark_*` passes and only fires when
+/// `mark_fast_var_length_paths` has already cleared `needs_path_info`, so
+/// the fused count is exactly the number of distinct targets the fast BFS
+/// would have produced. A WHERE (typically the safety net
+/// `push_where_into_match` leaves behind) is absorbed only when it reads
+/// nothing but the seed variable. WHY-BAIL: needs the fast (path-free)
+/// expansion, a single connection type and no edge variable/property/filter.
+pub(crate) fn pass_fuse_var_length_distinct_count(query: &mut CypherQuery, _ctx: &PassCtx) {
+    use crate::graph::languages::cypher::planner::simplification::collect_predicate_refs;
+
+    let (match_clause, where_predicate, return_clause, consumed) = match query.clauses.as_slice() {
+        [Clause::Match(m), Clause::Where(w), Clause::Return(r), ..] => {
+            (m, Some(&w.predicate), r, 3)
+        }
+        [Clause::Match(m), Clause::Return(r), ..] => (m, None, r, 2),
+        _ => return,
+    };
+    if return_clause.distinct || return_clause.having.is_some() || return_clause.items.len() != 1 {
+        return;
+    }
+    if match_clause.patterns.len() != 1
+        || !match_clause.path_assignments.is_empty()
+        || match_clause.limit_hint.is_some()
+    {
+        return;
+    }
+    let pat = &match_clause.patterns[0];
+    let (src_node, edge, tgt_node) = match pat.elements.as_slice() {
+        [PatternElement::Node(s), PatternElement::Edge(e), PatternElement::Node(t)] => (s, e, t),
+        _ => return,
+    };
+
+    // The fused executor walks one typed CSR adjacency: a single named
+    // connection type, no edge variable, no edge property or pushed filter.
+    if edge.var_length.is_none()
+        || edge.needs_path_info
+        || edge.variable.is_some()
+        || edge.connection_type.is_none()
+        || edge.connection_types.is_some()
+        || edge.properties.is_some()
+        || edge.edge_filter.is_some()
+    {
+        return;
+    }
+    let tgt_var = match tgt_node.variable.as_deref() {
+        Some(v) if src_node.variable.as_deref() != Some(v) => v,
+        _ => return,
+    };
+    let counts_distinct_target = matches!(
+        &return_clause.items[0].expression,
+        Expression::FunctionCall { name, args, distinct: true }
+            if name == "count"
+                && matches!(args.as_slice(), [Expression::Variable(v)] if v == tgt_var)
+    );
+    if !counts_distinct_target {
+        return;
+    }
+    if let Some(pred) = where_predicate {
+        let mut refs = std::collections::HashSet::new();
+        collect_predicate_refs(pred, &mut refs);
+        if !refs
+            .iter()
+            .all(|v| src_node.variable.as_deref() == Some(v.as_str()))
+        {
+            return;
+        }
+    }
+
+    let fused = Clause::FusedVarLengthDistinctCount {
+        match_clause: match_clause.clone(),
+        where_predicate: where_predicate.cloned(),
+        return_clause: return_clause.clone(),
+        alias: return_item_column_name(&return_clause.items[0]),
+    };
+    query.clauses.drain(0..consumed);
+    query.clauses.insert(0, fused);
+}
+
 pub(crate) fn fuse_count_short_circuits(
     query: &mut CypherQuery,
     has_secondary_labels: bool,
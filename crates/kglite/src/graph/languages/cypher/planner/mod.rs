@@ -31,7 +31,7 @@ use fusion::{
     fuse_anchored_edge_count, fuse_count_short_circuits, fuse_match_return_aggregate,
     fuse_match_with_aggregate, fuse_match_with_aggregate_top_k, fuse_node_scan_aggregate,
     fuse_node_scan_top_k, fuse_optional_match_aggregate, fuse_order_by_top_k, fuse_spatial_join,
-    fuse_vector_score_order_limit, mark_return_lazy_eligible,
+    fuse_vector_score_order_limit, mark_return_lazy_eligible, pass_fuse_var_length_distinct_count,
 };
 use index_selection::push_where_into_match;
 use join_order::{
@@ -95,6 +95,7 @@ type PassFn = fn(&mut CypherQuery, &PassCtx);
 /// | `fuse_vector_score_order_limit` / `fuse_order_by_top_k` | safe-by-shape | Match `(Return, OrderBy, Limit)` adjacency; a CallSubquery breaks it. |
 /// | `reorder_predicates_by_cost` | safe-by-shape | Reorders predicates WITHIN one WHERE. |
 /// | `mark_disjoint_fixed_trails` / `mark_fast_var_length_paths` / `mark_skip_target_type_check` | safe-by-shape | Mark flags on edge elements WITHIN MATCH clauses; CallSubquery hits `_ => continue`. The downstream-dedup-safety scan stops at the first Return/With, which a CallSubquery is not. |
+/// | `fuse_var_length_distinct_count` | safe-by-shape | Fires only when the query OPENS with `(Match, Return)`; a CallSubquery is neither. |
 ///
 /// When in doubt the rule is: correctness beats optimization — a pass
 /// that can't confidently reason about a CallSubquery should bail on any
@@ -185,6 +186,12 @@ pub const PASSES: &[(&str, PassFn)] = &[
         "mark_skip_target_type_check",
         pass_mark_skip_target_type_check,
     ),
+    // LAST: absorbs the MATCH only after the mark_* passes above have
+    // cleared `needs_path_info` and set `skip_target_type_check` on it.
+    (
+        "fuse_var_length_distinct_count",
+        pass_fuse_var_length_distinct_count,
+    ),
 ];
 
 /// Returns true iff `name` is a registered pass name. PyAPI uses this to
@@ -494,6 +501,7 @@ pub(crate) fn seed_ignoring_fusion_passes() -> &'static HashSet<String> {
         [
             "fuse_anchored_edge_count",
             "fuse_count_short_circuits",
+            "fuse_var_length_distinct_count",
             "fuse_optional_match_aggregate",
             "fuse_match_return_aggregate",
             "fuse_match_with_aggregate",
@@ -1799,3 +1799,53 @@ fn lazy_eligibility_corpus() {
         "MATCH (p:Person) RETURN p.name AS name, p.age AS age"
     ));
 }
+
+#[test]
+fn test_fuse_var_length_distinct_count() {
+    let mut query = parse_cypher(
+        "MATCH (n:Node)-[:LINKED*1..3]->(m:Node) WHERE n.id IN [1, 2, 3] \
+         RETURN count(DISTINCT m) AS cnt",
+    )
+    .unwrap();
+    let graph = DirGraph::new();
+    let params = HashMap::new();
+    optimize(&mut query, &graph, &params);
+    assert!(
+        matches!(
+            query.clauses.as_slice(),
+            [Clause::FusedVarLengthDistinctCount { where_predicate: Some(_), alias, .. }]
+                if alias == "cnt"
+        ),
+        "seed-only WHERE must be absorbed into the fused count: {:#?}",
+        query.clauses
+    );
+}
+
+#[test]
+fn test_var_length_distinct_count_rejects_unsupported_shapes() {
+    let queries = [
+        // per-path count, not distinct targets
+        "MATCH (n:Node)-[:LINKED*1..3]->(m:Node) RETURN count(m) AS cnt",
+        // WHERE reads the target
+        "MATCH (n:Node)-[:LINKED*1..3]->(m:Node) WHERE m.x > 1 RETURN count(DISTINCT m) AS cnt",
+        // named edge variable / multiple types / untyped
+        "MATCH (n:Node)-[r:LINKED*1..3]->(m:Node) RETURN count(DISTINCT m) AS cnt",
+        "MATCH (n:Node)-[:LINKED|OTHER*1..3]->(m:Node) RETURN count(DISTINCT m) AS cnt",
+        "MATCH (n:Node)-[*1..3]->(m:Node) RETURN count(DISTINCT m) AS cnt",
+        // counts the seed side
+        "MATCH (n:Node)-[:LINKED*1..3]->(m:Node) RETURN count(DISTINCT n) AS cnt",
+    ];
+    let graph = DirGraph::new();
+    let params = HashMap::new();
+    for source in queries {
+        let mut query = parse_cypher(source).unwrap();
+        optimize(&mut query, &graph, &params);
+        assert!(
+            !query
+                .clauses
+                .iter()
+                .any(|c| matches!(c, Clause::FusedVarLengthDistinctCount { .. })),
+            "must not fuse: {source}"
+        );
+    }
+}
@@ -1469,6 +1469,7 @@ fn collect_clause_variables(clause: &Clause, out: &mut HashSet<String>) {
         | Clause::FusedCountTypedNode { .. }
         | Clause::FusedCountTypedEdge { .. }
         | Clause::FusedCountAnchoredEdges { .. }
+        | Clause::FusedVarLengthDistinctCount { .. }
         | Clause::FusedNodeScanAggregate { .. }
         | Clause::FusedNodeScanTopK { .. }
         | Clause::SpatialJoin { .. } => {
@@ -1525,7 +1526,9 @@ fn collect_property_matcher_refs(m: &PropertyMatcher, out: &mut HashSet<String>)
     }
 }
 
-fn collect_predicate_refs(pred: &Predicate, out: &mut HashSet<String>) {
+/// Collect every variable a predicate *reads*. Over-collects like
+/// [`collect_expression_refs`].
+pub(crate) fn collect_predicate_refs(pred: &Predicate, out: &mut HashSet<String>) {
     match pred {
         Predicate::Comparison { left, right, .. } => {
             collect_expression_refs(left, out);
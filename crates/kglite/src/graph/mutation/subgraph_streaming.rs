@@ -64,6 +64,41 @@ impl Bitset {
         }
     }
 
+    /// Set bit `i`, returning whether it was clear before — a single
+    /// block load for test-and-mark visited checks in traversals.
+    /// Out-of-range ids are not recorded and return false.
+    #[inline]
+    pub fn insert(&mut self, i: usize) -> bool {
+        if i >= self.len {
+            return false;
+        }
+        let block = &mut self.blocks[i / 64];
+        let mask = 1u64 << (i % 64);
+        let fresh = *block & mask == 0;
+        *block |= mask;
+        fresh
+    }
+
+    /// Clear bit `i`. Out-of-range writes are ignored.
+    #[inline]
+    pub fn unset(&mut self, i: usize) {
+        if i < self.len {
+            self.blocks[i / 64] &= !(1u64 << (i % 64));
+        }
+    }
+
+    /// OR `other` into `self`, one block at a time. Bits past `self.len()`
+    /// are not taken from a longer `other`.
+    pub fn union_with(&mut self, other: &Bitset) {
+        let n = self.blocks.len().min(other.blocks.len());
+        for (block, &theirs) in self.blocks[..n].iter_mut().zip(&other.blocks[..n]) {
+            *block |= theirs;
+        }
+        if !self.len.is_multiple_of(64) && n == self.blocks.len() {
+            self.blocks[n - 1] &= (1u64 << (self.len % 64)) - 1;
+        }
+    }
+
     /// Read bit `i`. Out-of-range reads return false.
     #[inline]
     pub fn get(&self, i: usize) -> bool {
@@ -79,7 +114,8 @@ impl Bitset {
         self.len
     }
 
-    /// Total set bits. Used to size the output graph.
+    /// Total set bits. Used to size the output graph and as the answer of
+    /// bitset-backed distinct counts.
     pub fn count_ones(&self) -> u64 {
         self.blocks.iter().map(|b| b.count_ones() as u64).sum()
     }
@@ -1095,6 +1131,33 @@ mod tests {
         assert_eq!(bs.count_ones(), 4);
     }
 
+    #[test]
+    fn bitset_insert_reports_first_visit_only() {
+        let mut bs = Bitset::with_len(130);
+        assert!(bs.insert(64));
+        assert!(!bs.insert(64));
+        assert!(bs.insert(129));
+        assert!(!bs.insert(130)); // out of range: not recorded
+        assert!(bs.get(64) && bs.get(129) && !bs.get(65));
+        assert_eq!(bs.count_ones(), 2);
+    }
+
+    #[test]
+    fn bitset_union_and_unset() {
+        let mut a = Bitset::with_len(70);
+        a.set(1);
+        a.set(69);
+        let mut b = Bitset::with_len(200);
+        b.set(1);
+        b.set(64);
+        b.set(150); // past a's length: not copied
+        a.union_with(&b);
+        a.unset(69);
+        a.unset(300); // ignored, not panic
+        assert!(a.get(1) && a.get(64) && !a.get(69));
+        assert_eq!(a.count_ones(), 2);
+    }
+
     #[test]
     fn bitset_out_of_range_writes_are_ignored() {
         let mut bs = Bitset::with_len(100);
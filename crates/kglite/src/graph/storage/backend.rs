@@ -8,7 +8,9 @@
 use crate::graph::schema::{EdgeData, InternedKey, NodeData};
 use crate::graph::storage::recording::RecordingGraph;
 use crate::graph::storage::undo::UndoJournal;
-use crate::graph::storage::{GraphRead, GraphWrite, MappedGraph, MemoryGraph};
+use crate::graph::storage::{
+    GraphRead, GraphWrite, MappedGraph, MemoryGraph, MemoryTypedAdjacency,
+};
 use petgraph::graph::{EdgeIndex, NodeIndex};
 use petgraph::stable_graph::StableDiGraph;
 use serde::{Deserialize, Deserializer, Serialize, Serializer};
@@ -448,6 +450,41 @@ impl GraphBackend {
             GraphBackend::Mapped(_) | GraphBackend::Disk(_) => None,
         })
     }
+
+    /// Borrow the default heap backend's CSR adjacency for one
+    /// connection type, building it on first use. `None` when the type has
+    /// no edges or the backend keeps no such index; disk already
+    /// pre-filters typed edges from its own CSR. The build scans every
+    /// edge, so only callers that amortise it over many BFSs should use
+    /// this; per-source expansion takes [`Self::existing_typed_adjacency`].
+    pub(crate) fn cached_typed_adjacency(
+        &self,
+        conn_type: InternedKey,
+        deadline: Option<std::time::Instant>,
+    ) -> Result<Option<Arc<MemoryTypedAdjacency>>, String> {
+        Ok(match self {
+            GraphBackend::Memory(graph) => {
+                graph.ensure_typed_adjacency_with_deadline(conn_type, deadline)?
+            }
+            GraphBackend::Recording(graph) => {
+                graph.inner().cached_typed_adjacency(conn_type, deadline)?
+            }
+            GraphBackend::Mapped(_) | GraphBackend::Disk(_) => None,
+        })
+    }
+
+    /// [`Self::cached_typed_adjacency`] without the build: the adjacency
+    /// only if an earlier query already paid for it.
+    pub(crate) fn existing_typed_adjacency(
+        &self,
+        conn_type: InternedKey,
+    ) -> Option<Arc<MemoryTypedAdjacency>> {
+        match self {
+            GraphBackend::Memory(graph) => graph.existing_typed_adjacency(conn_type),
+            GraphBackend::Recording(graph) => graph.inner().existing_typed_adjacency(conn_type),
+            GraphBackend::Mapped(_) | GraphBackend::Disk(_) => None,
+        }
+    }
 }
 
 // -- Index traits --
@@ -367,7 +367,7 @@ impl GraphWrite for MemoryGraph {
 
     #[inline]
     fn edge_weight_mut(&mut self, idx: EdgeIndex) -> Option<&mut EdgeData> {
-        self.invalidate_peer_counts();
+        self.invalidate_edge_indexes();
         if self.undo.is_some() {
             self.capture_edge_weight(idx);
         }
@@ -386,7 +386,7 @@ impl GraphWrite for MemoryGraph {
 
     #[inline]
     fn remove_node(&mut self, idx: NodeIndex) -> Option<NodeData> {
-        self.invalidate_peer_counts();
+        self.invalidate_edge_indexes();
         if self.undo.is_some() {
             self.detach_for_journal(idx);
         }
@@ -399,7 +399,7 @@ impl GraphWrite for MemoryGraph {
 
     #[inline]
     fn add_edge(&mut self, a: NodeIndex, b: NodeIndex, data: EdgeData) -> EdgeIndex {
-        self.invalidate_peer_counts();
+        self.invalidate_edge_indexes_of(data.connection_type);
         let idx = self.inner.add_edge(a, b, data);
         if let Some(journal) = self.undo.as_deref_mut() {
             journal.note_edge_added(idx);
@@ -409,7 +409,9 @@ impl GraphWrite for MemoryGraph {
 
     #[inline]
     fn remove_edge(&mut self, idx: EdgeIndex) -> Option<EdgeData> {
-        self.invalidate_peer_counts();
+        if let Some(conn_type) = self.inner.edge_weight(idx).map(|e| e.connection_type) {
+            self.invalidate_edge_indexes_of(conn_type);
+        }
         let endpoints = self.undo.is_some().then(|| self.inner.edge_endpoints(idx));
         let removed = self.inner.remove_edge(idx)?;
         if let Some(journal) = self.undo.as_deref_mut() {
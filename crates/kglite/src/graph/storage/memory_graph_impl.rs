@@ -8,12 +8,27 @@ use std::sync::Arc;
 use std::time::Instant;
 
 impl MemoryGraph {
-    /// Drop derived edge counts after any mutation that can change edge type,
-    /// identity, or endpoints.
-    pub(crate) fn invalidate_peer_counts(&mut self) {
+    /// Drop derived edge counts and adjacency after any mutation that can
+    /// change edge type, identity, or endpoints.
+    pub(crate) fn invalidate_edge_indexes(&mut self) {
         if let Ok(mut cache) = self.peer_counts.write() {
             cache.clear();
         }
+        if let Ok(mut cache) = self.typed_adjacency.write() {
+            cache.clear();
+        }
+    }
+
+    /// [`Self::invalidate_edge_indexes`] for a mutation that adds or removes
+    /// edges of one type only; other types' counts and adjacency stay valid.
+    pub(crate) fn invalidate_edge_indexes_of(&mut self, conn_type: InternedKey) {
+        let key = conn_type.as_u64();
+        if let Ok(mut cache) = self.peer_counts.write() {
+            cache.remove(&key);
+        }
+        if let Ok(mut cache) = self.typed_adjacency.write() {
+            cache.remove(key);
+        }
     }
 
     /// Fetch or build source/target counts for one relationship type.
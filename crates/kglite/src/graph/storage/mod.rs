@@ -29,6 +29,7 @@ pub mod mode;
 pub mod overflow;
 mod packed_codec;
 pub mod type_build_meta;
+mod typed_adjacency;
 pub mod undo;
 
 use crate::datatypes::Value;
@@ -508,6 +509,9 @@ pub struct MemoryGraph {
     /// aggregations. Derived state: empty on clone/load and invalidated by
     /// every edge mutation.
     pub(crate) peer_counts: RwLock<HashMap<u64, Arc<MemoryPeerCounts>>>,
+    /// Lazy per-connection-type CSR adjacency for order-insensitive
+    /// var-length traversals. Same lifecycle as `peer_counts`, size-capped.
+    pub(crate) typed_adjacency: RwLock<TypedAdjacencyCache>,
     /// Statement-scoped inverse-op buffer. `Some` only while a mutating
     /// Cypher statement holds a rollback checkpoint; `None` is the steady
     /// state, so reads pay nothing and writes pay one discriminant check.
@@ -647,13 +651,9 @@ impl MappedPropertyIndex {
 
 impl Clone for MemoryGraph {
     fn clone(&self) -> Self {
-        Self {
-            inner: self.inner.clone(),
-            peer_counts: RwLock::new(HashMap::new()),
-            // A journal belongs to the statement that opened it, never to a
-            // copy of the graph it was recorded against.
-            undo: None,
-        }
+        // Derived caches start empty, and a journal belongs to the statement
+        // that opened it, never to a copy of the graph it was recorded against.
+        Self::from_graph(self.inner.clone())
     }
 }
 
@@ -668,6 +668,7 @@ impl MemoryGraph {
         Self {
             inner,
             peer_counts: RwLock::new(HashMap::new()),
+            typed_adjacency: RwLock::default(),
             undo: None,
         }
     }
@@ -794,3 +795,4 @@ pub mod recording;
 // this exact line survives.
 #[allow(unused_imports)]
 pub use recording::RecordingGraph;
+pub(crate) use typed_adjacency::{MemoryTypedAdjacency, TypedAdjacencyCache};
@@ -0,0 +1,357 @@
+//! Lazy per-connection-type CSR adjacency for the default in-memory backend,
+//! walked by order-insensitive variable-length traversals.
+
+use super::MemoryGraph;
+use crate::graph::schema::InternedKey;
+use petgraph::graph::NodeIndex;
+use petgraph::visit::{EdgeRef, IntoEdgeReferences};
+use petgraph::Direction;
+use std::collections::{HashMap, VecDeque};
+use std::sync::Arc;
+use std::time::Instant;
+
+/// Heap budget for all cached adjacencies together. An entry is sized by
+/// its type's edges and endpoints, not by the graph's node range, and the
+/// oldest builds are evicted first once the budget is exceeded.
+const MAX_CACHED_BYTES: usize = 256 << 20;
+
+/// Bytes charged per cache entry on top of its arrays, so types recorded
+/// as edgeless still count against the budget.
+const ENTRY_OVERHEAD_BYTES: usize = 64;
+
+/// Flat CSR adjacency for one connection type on the heap backend.
+///
+/// Only nodes with at least one edge of the type are laid out: each gets a
+/// dense *local* id (its rank in `nodes`), and offsets and peers are local
+/// ids, so the arrays and any bitset over them scale with the typed
+/// subgraph rather than the whole graph. A neighbour lookup is two array
+/// loads and a contiguous slice instead of walking petgraph's per-node
+/// edge linked list and comparing every edge's type. Peers are laid out in
+/// edge-index order, which is *not* `edges_directed` order, so only
+/// consumers that have proven row order unobservable may walk it.
+#[derive(Debug, Default)]
+pub(crate) struct MemoryTypedAdjacency {
+    /// Graph node index of each local id, ascending.
+    pub(crate) nodes: Vec<u32>,
+    /// `out_targets[out_offsets[n]..out_offsets[n + 1]]` are the targets
+    /// of local node `n`'s outgoing edges of this type.
+    pub(crate) out_offsets: Vec<u32>,
+    pub(crate) out_targets: Vec<u32>,
+    /// Same layout for incoming edges, holding the edge sources.
+    pub(crate) in_offsets: Vec<u32>,
+    pub(crate) in_sources: Vec<u32>,
+}
+
+impl MemoryTypedAdjacency {
+    /// Number of local ids: the nodes with an edge of this type.
+    #[inline]
+    pub(crate) fn node_count(&self) -> usize {
+        self.nodes.len()
+    }
+
+    /// Local id of a graph node; `None` when it has no edge of this type
+    /// (including nodes added after the build — every edge mutation of the
+    /// type invalidates it).
+    #[inline]
+    pub(crate) fn local_id(&self, node: NodeIndex) -> Option<u32> {
+        let node = u32::try_from(node.index()).ok()?;
+        self.nodes
+            .binary_search(&node)
+            .ok()
+            .map(|local| local as u32)
+    }
+
+    /// Graph node of a local id.
+    #[inline]
+    pub(crate) fn node_index(&self, local: u32) -> NodeIndex {
+        NodeIndex::new(self.nodes[local as usize] as usize)
+    }
+
+    /// Local peers of local node `local` across edges of this type in `dir`.
+    #[inline]
+    pub(crate) fn neighbors(&self, local: usize, dir: Direction) -> &[u32] {
+        let (offsets, flat) = match dir {
+            Direction::Outgoing => (&self.out_offsets, &self.out_targets),
+            Direction::Incoming => (&self.in_offsets, &self.in_sources),
+        };
+        match (offsets.get(local), offsets.get(local + 1)) {
+            (Some(&lo), Some(&hi)) => &flat[lo as usize..hi as usize],
+            _ => &[],
+        }
+    }
+
+    /// Heap held by the arrays, for the cache budget.
+    fn heap_bytes(&self) -> usize {
+        let words = self.nodes.len()
+            + self.out_offsets.len()
+            + self.out_targets.len()
+            + self.in_offsets.len()
+            + self.in_sources.len();
+        words * std::mem::size_of::<u32>()
+    }
+
+    /// Rank one type's `(source, target)` graph edges into local ids and
+    /// counting-sort them into both directions' CSR.
+    pub(crate) fn from_edges(edges: &[(u32, u32)]) -> Self {
+        let mut nodes: Vec<u32> = edges.iter().flat_map(|&(s, t)| [s, t]).collect();
+        nodes.sort_unstable();
+        nodes.dedup();
+        let local = |node: u32| nodes.partition_point(|&n| n < node) as u32;
+        let local_edges: Vec<(u32, u32)> =
+            edges.iter().map(|&(s, t)| (local(s), local(t))).collect();
+        let n = nodes.len();
+        let flatten = |key: fn(&(u32, u32)) -> (u32, u32)| {
+            let mut offsets = vec![0u32; n + 1];
+            for edge in &local_edges {
+                offsets[key(edge).0 as usize + 1] += 1;
+            }
+            for i in 0..n {
+                offsets[i + 1] += offsets[i];
+            }
+            let mut cursor = offsets[..n].to_vec();
+            let mut peers = vec![0u32; local_edges.len()];
+            for edge in &local_edges {
+                let (node, peer) = key(edge);
+                let slot = &mut cursor[node as usize];
+                peers[*slot as usize] = peer;
+                *slot += 1;
+            }
+            (offsets, peers)
+        };
+        let (out_offsets, out_targets) = flatten(|&(s, t)| (s, t));
+        let (in_offsets, in_sources) = flatten(|&(s, t)| (t, s));
+        Self {
+            nodes,
+            out_offsets,
+            out_targets,
+            in_offsets,
+            in_sources,
+        }
+    }
+}
+
+/// Built adjacencies by interned type key. `None` records a type with no
+/// edges, so a misspelt or unused type costs neither arrays nor a rescan
+/// on the next query.
+#[derive(Debug)]
+pub(crate) struct TypedAdjacencyCache {
+    entries: HashMap<u64, Option<Arc<MemoryTypedAdjacency>>>,
+    /// Keys in build order, oldest first, for eviction.
+    built: VecDeque<u64>,
+    /// Sum of [`entry_bytes`] over `entries`, kept within `budget`.
+    bytes: usize,
+    budget: usize,
+}
+
+impl Default for TypedAdjacencyCache {
+    fn default() -> Self {
+        Self {
+            entries: HashMap::new(),
+            built: VecDeque::new(),
+            bytes: 0,
+            budget: MAX_CACHED_BYTES,
+        }
+    }
+}
+
+/// Budget charge of one cache entry.
+fn entry_bytes(entry: &Option<Arc<MemoryTypedAdjacency>>) -> usize {
+    ENTRY_OVERHEAD_BYTES + entry.as_ref().map_or(0, |adj| adj.heap_bytes())
+}
+
+impl TypedAdjacencyCache {
+    pub(crate) fn clear(&mut self) {
+        self.entries.clear();
+        self.built.clear();
+        self.bytes = 0;
+    }
+
+    /// Drop one type's entry, after a mutation that touched only its edges.
+    pub(crate) fn remove(&mut self, key: u64) {
+        if let Some(entry) = self.entries.remove(&key) {
+            self.bytes -= entry_bytes(&entry);
+            self.built.retain(|&k| k != key);
+        }
+    }
+
+    /// Store `built` under `key` unless a concurrent build won the race, and
+    /// return whichever entry is cached. An entry larger than the whole
+    /// budget is handed back without being cached.
+    fn insert(
+        &mut self,
+        key: u64,
+        built: Option<Arc<MemoryTypedAdjacency>>,
+    ) -> Option<Arc<MemoryTypedAdjacency>> {
+        if let Some(existing) = self.entries.get(&key) {
+            return existing.clone();
+        }
+        let size = entry_bytes(&built);
+        if size > self.budget {
+            return built;
+        }
+        while self.bytes + size > self.budget {
+            let Some(oldest) = self.built.pop_front() else {
+                break;
+            };
+            if let Some(entry) = self.entries.remove(&oldest) {
+                self.bytes -= entry_bytes(&entry);
+            }
+        }
+        self.built.push_back(key);
+        self.bytes += size;
+        self.entries.insert(key, built.clone());
+        built
+    }
+}
+
+impl MemoryGraph {
+    /// The CSR adjacency for one relationship type if an earlier query
+    /// already built it. Never scans; `None` when not cached or the type
+    /// has no edges.
+    pub(crate) fn existing_typed_adjacency(
+        &self,
+        conn_type: InternedKey,
+    ) -> Option<Arc<MemoryTypedAdjacency>> {
+        let cache = self.typed_adjacency.read().ok()?;
+        cache.entries.get(&conn_type.as_u64()).cloned().flatten()
+    }
+
+    /// Fetch or build the CSR adjacency for one relationship type; `None`
+    /// when the type has no edges.
+    ///
+    /// One pass over the edge list collects the type's edges; arrays are
+    /// only allocated when there is at least one. Deadline is checked
+    /// every 2^20 edges, like the peer-count build.
+    pub(crate) fn ensure_typed_adjacency_with_deadline(
+        &self,
+        conn_type: InternedKey,
+        deadline: Option<Instant>,
+    ) -> Result<Option<Arc<MemoryTypedAdjacency>>, String> {
+        let key = conn_type.as_u64();
+        if let Ok(cache) = self.typed_adjacency.read() {
+            if let Some(adjacency) = cache.entries.get(&key) {
+                return Ok(adjacency.clone());
+            }
+        }
+
+        let mut edges: Vec<(u32, u32)> = Vec::new();
+        for (edge_idx, edge) in self.inner.edge_references().enumerate() {
+            if edge_idx.is_multiple_of(1 << 20) && deadline.is_some_and(|dl| Instant::now() > dl) {
+                return Err("Query timed out".to_string());
+            }
+            if edge.weight().connection_type == conn_type {
+                edges.push((edge.source().index() as u32, edge.target().index() as u32));
+            }
+        }
+        let built = (!edges.is_empty()).then(|| Arc::new(MemoryTypedAdjacency::from_edges(&edges)));
+        let mut cache = match self.typed_adjacency.write() {
+            Ok(cache) => cache,
+            Err(_) => return Ok(built),
+        };
+        Ok(cache.insert(key, built))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::datatypes::Value;
+    use crate::graph::schema::{EdgeData, NodeData, StringInterner};
+    use crate::graph::storage::GraphWrite;
+
+    #[test]
+    fn csr_lists_each_nodes_peers_in_both_directions() {
+        let adj = MemoryTypedAdjacency::from_edges(&[(2, 0), (0, 1), (2, 1), (0, 2)]);
+        assert_eq!(adj.neighbors(0, Direction::Outgoing), &[1, 2]);
+        assert_eq!(adj.neighbors(2, Direction::Outgoing), &[0, 1]);
+        assert_eq!(adj.neighbors(1, Direction::Incoming), &[0, 2]);
+        assert!(adj.neighbors(1, Direction::Outgoing).is_empty());
+        // Past the local range: no edges rather than a panic.
+        assert!(adj.neighbors(9, Direction::Incoming).is_empty());
+    }
+
+    #[test]
+    fn csr_spans_only_the_typed_nodes() {
+        let adj = MemoryTypedAdjacency::from_edges(&[(900_000, 7), (7, 45), (45, 900_000)]);
+        assert_eq!(adj.node_count(), 3);
+        assert_eq!(adj.out_offsets.len(), 4);
+        let local = |n| adj.local_id(NodeIndex::new(n)).unwrap();
+        let peers = adj.neighbors(local(900_000) as usize, Direction::Outgoing);
+        assert_eq!(peers, &[local(7)]);
+        assert_eq!(adj.node_index(local(45)), NodeIndex::new(45));
+        // A node with no edge of the type has no local id.
+        assert_eq!(adj.local_id(NodeIndex::new(8)), None);
+    }
+
+    #[test]
+    fn cache_evicts_the_oldest_builds_past_the_byte_budget() {
+        let chain: Vec<(u32, u32)> = (0..100).map(|n| (n, n + 1)).collect();
+        let big = Some(Arc::new(MemoryTypedAdjacency::from_edges(&chain)));
+        let share = entry_bytes(&big);
+        let mut cache = TypedAdjacencyCache {
+            budget: 3 * share,
+            ..TypedAdjacencyCache::default()
+        };
+        for key in 0..4 {
+            cache.insert(key, big.clone());
+        }
+        assert_eq!(cache.bytes, 3 * share);
+        assert!(!cache.entries.contains_key(&0));
+        assert!(cache.entries.contains_key(&3));
+
+        cache.remove(3);
+        assert_eq!(cache.bytes, 2 * share);
+        // Edgeless types are charged too, so they cannot grow the map
+        // without bound either.
+        for key in 100..100 + 2 * share as u64 {
+            cache.insert(key, None);
+        }
+        assert!(cache.bytes <= cache.budget);
+        assert!(!cache.entries.contains_key(&1));
+
+        // Larger than the whole budget: returned, never cached.
+        cache.budget = share - 1;
+        assert!(cache.insert(7, big.clone()).is_some());
+        assert!(!cache.entries.contains_key(&7));
+    }
+
+    #[test]
+    fn an_edge_write_drops_only_its_own_type() {
+        let mut interner = StringInterner::new();
+        let mut g = MemoryGraph::new();
+        let nodes: Vec<NodeIndex> = (0..3)
+            .map(|id| {
+                g.add_node(NodeData::new(
+                    Value::UniqueId(id),
+                    Value::Null,
+                    "Person".to_string(),
+                    HashMap::new(),
+                    &mut interner,
+                ))
+            })
+            .collect();
+        let knows_edge = EdgeData::new("KNOWS".to_string(), HashMap::new(), &mut interner);
+        let likes_edge = EdgeData::new("LIKES".to_string(), HashMap::new(), &mut interner);
+        g.add_edge(nodes[0], nodes[1], knows_edge);
+        g.add_edge(nodes[1], nodes[2], likes_edge.clone());
+        let knows = InternedKey::from_str("KNOWS");
+        let likes = InternedKey::from_str("LIKES");
+        for ty in [knows, likes] {
+            assert!(g
+                .ensure_typed_adjacency_with_deadline(ty, None)
+                .unwrap()
+                .is_some());
+        }
+
+        g.add_edge(nodes[2], nodes[0], likes_edge);
+        assert!(g.existing_typed_adjacency(knows).is_some());
+        assert!(g.existing_typed_adjacency(likes).is_none());
+
+        let rebuilt = g.ensure_typed_adjacency_with_deadline(likes, None).unwrap();
+        assert_eq!(rebuilt.map(|adj| adj.in_sources.len()), Some(2));
+        let first = g.inner.edge_indices().next().unwrap();
+        g.remove_edge(first);
+        assert!(g.existing_typed_adjacency(knows).is_none());
+        assert!(g.existing_typed_adjacency(likes).is_some());
+    }
+}
@@ -10,9 +10,12 @@ Run:
     pytest tests/benchmarks/test_multihop.py -v -s -m benchmark -k "Summary"
 """
 
-import random
+import os
+from pathlib import Path
 import time
+import zipfile
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -31,62 +34,153 @@ QUERY_TIMEOUT_S = 30.0
 # ============================================================================
 
 
-def _build_scale_free_graph(n_nodes: int, edges_per_node: int = 4, seed: int = 42):
+def _preferential_attachment_edges(n_nodes: int, edges_per_node: int, rng: np.random.Generator):
+    """Return a preferential-attachment edge list as a ("src", "tgt") record array.
+
+    Every edge owns two endpoint slots (source, then target) laid out in
+    creation order, which is exactly the classic "repeated nodes" list. A new
+    node's targets are copies of uniformly drawn earlier slots, so each is
+    picked in proportion to degree. Because every new node adds the same
+    number of edges, the slot layout is known up front and all draws can be
+    resolved at once by pointer jumping (Batagelj & Brandes, 2005). A node
+    that drew the same target twice redraws the later slot until its targets
+    are distinct, like the sequential sampler does.
+    """
+    core_size = max(edges_per_node + 1, 5)
+    core_src, core_tgt = np.triu_indices(core_size, k=1)
+    n_core = core_src.size
+    n_new = max(n_nodes - core_size, 0)
+    n_slots = 2 * (n_core + n_new * edges_per_node)
+
+    # Node ids and slot indices both fit int32 at every benchmark size, so
+    # every array here is int32: half the memory traffic of NumPy's int64
+    # default, and the edge columns reach the loader already narrow.
+    assert n_slots < 2**31, "slot indices must fit int32"
+
+    # Slot values known before sampling: the core clique and every source.
+    known = np.empty(n_slots, dtype=np.int32)
+    known[0 : 2 * n_core : 2] = core_src
+    known[1 : 2 * n_core : 2] = core_tgt
+    sources = known[2 * n_core :: 2]
+    sources[:] = np.arange(core_size, core_size + n_new, dtype=np.int32).repeat(edges_per_node)
+
+    # The sampled slots are every other slot after the core: a strided view,
+    # so neither they nor the sources need an index array of their own.
+    target_slots = slice(2 * n_core + 1, n_slots, 2)
+    # A node samples from the slots filled before its own edges are added.
+    limits = 2 * (n_core + (sources - core_size) * edges_per_node)
+    draws = rng.integers(0, limits, dtype=np.int32)
+
+    # Two slot-sized buffers serve every round: each jump writes into the
+    # spare and the two swap roles. ("clip" is a no-op on these in-range
+    # indices, but unlike the default it lets `take` write straight into
+    # `out` instead of through a temporary.) Only target slots ever point
+    # elsewhere, and a redraw round resets exactly those.
+    ptr = np.arange(n_slots, dtype=np.int32)
+    spare = np.empty_like(ptr)
+    while True:
+        ptr[target_slots] = draws
+        while True:
+            np.take(ptr, ptr, out=spare, mode="clip")
+            if np.array_equal(spare, ptr):
+                break
+            ptr, spare = spare, ptr
+        targets = known[ptr[target_slots]].reshape(n_new, edges_per_node)
+        dup = np.zeros(targets.shape, dtype=bool)
+        for c in range(1, edges_per_node):
+            dup[:, c] = (targets[:, :c] == targets[:, c : c + 1]).any(axis=1)
+        dup = dup.ravel()
+        if not dup.any():
+            break
+        draws[dup] = rng.integers(0, limits[dup], dtype=np.int32)
+
+    # Slots pair up as (source, target), so the resolved slot array already
+    # is the edge list: view it as records rather than copying columns out.
+    return known[ptr].view(np.dtype([("src", known.dtype), ("tgt", known.dtype)]))
+
+
+def _scale_free_edges(n_nodes: int, edges_per_node: int, seed: int):
+    """Return (edges, seed_ids) for the benchmark graph -- fully determined by the arguments."""
+    rng = np.random.default_rng(seed)
+    edges = _preferential_attachment_edges(n_nodes, edges_per_node, rng)
+
+    # 15 highest-degree nodes (by outgoing edges). Every non-core node has
+    # exactly `edges_per_node` out-edges, so ties are broken by a seeded
+    # shuffle rather than creation order (which would pick only the oldest
+    # nodes, whose reach is a handful of core nodes).
+    order = rng.permutation(n_nodes)
+    neg_degree = -np.bincount(edges["src"], minlength=n_nodes)[order]
+    n_seeds = min(15, n_nodes)
+    top = np.argpartition(neg_degree, n_seeds - 1)[:n_seeds]
+    top = top[np.argsort(neg_degree[top], kind="stable")]
+    return edges, order[top]
+
+
+# Bump when the generator changes so stale on-disk edge caches are ignored.
+_EDGE_CACHE_VERSION = 3
+
+
+def _cached_scale_free_edges(cache_dir: Path | None, n_nodes: int, edges_per_node: int, seed: int):
+    """`_scale_free_edges`, memoised as an .npz under `cache_dir` across pytest runs."""
+    if cache_dir is None:
+        return _scale_free_edges(n_nodes, edges_per_node, seed)
+    path = cache_dir / f"sf_v{_EDGE_CACHE_VERSION}_{n_nodes}_{edges_per_node}_{seed}.npz"
+    if path.exists():
+        try:
+            with np.load(path) as cached:
+                return cached["edges"], cached["seeds"]
+        except (OSError, EOFError, ValueError, KeyError, zipfile.BadZipFile):
+            pass  # unreadable cache file: regenerate and overwrite it
+    edges, seed_ids = _scale_free_edges(n_nodes, edges_per_node, seed)
+    # Write beside the final path and rename into place, so an interrupted
+    # run or a concurrent worker never leaves a truncated file under it.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, edges=edges, seeds=seed_ids)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return edges, seed_ids
+
+
+def _build_scale_free_graph(n_nodes: int, edges_per_node: int = 4, seed: int = 42, cache_dir: Path | None = None):
     """Build a scale-free-ish graph with controllable density.
 
     Uses preferential attachment (Barabasi-Albert style) so a few hub nodes
     have high degree -- realistic for biological/social networks and the kind
     of graph TuringDB benchmarks against.
 
+    With `cache_dir`, the generated edge list is reused from disk on later
+    runs; the graph itself is always loaded fresh so every run measures the
+    same in-memory storage.
+
     Returns (graph, seed_node_ids, n_edges) where seed_node_ids are the 15
     highest-degree nodes (matching TuringDB's "set of 15 seed nodes").
     """
-    rng = random.Random(seed)
-
-    # --- Build edges via preferential attachment ---
-    core_size = max(edges_per_node + 1, 5)
-    edge_set: set[tuple[int, int]] = set()
-    repeated_nodes: list[int] = []
-
-    for i in range(core_size):
-        for j in range(i + 1, core_size):
-            edge_set.add((i, j))
-            repeated_nodes.extend([i, j])
-
-    for new_node in range(core_size, n_nodes):
-        chosen: set[int] = set()
-        attempts = 0
-        while len(chosen) < edges_per_node and attempts < edges_per_node * 10:
-            t = rng.choice(repeated_nodes)
-            if t != new_node:
-                chosen.add(t)
-            attempts += 1
-        for t in chosen:
-            edge_set.add((new_node, t))
-            repeated_nodes.extend([new_node, t])
+    edges, seed_ids = _cached_scale_free_edges(cache_dir, n_nodes, edges_per_node, seed)
 
     # --- Load into KGLite ---
+    # Columns go in as NumPy arrays: the loader reads a DataFrame column by
+    # column, so there is no need for per-row Python objects (a list of
+    # dicts, a list of ints) on the way in. No query reads a node title, so
+    # none is generated: the title falls back to the id rather than costing
+    # one Python string per node on both sides of the loader.
     graph = KnowledgeGraph()
-    node_df = pd.DataFrame(
-        {
-            "id": list(range(n_nodes)),
-            "name": [f"N{i}" for i in range(n_nodes)],
-            "group": [i % 20 for i in range(n_nodes)],
-        }
-    )
-    graph.add_nodes(node_df, "Node", "id", "name")
-
-    edge_list = [{"src": s, "tgt": t} for s, t in edge_set]
-    edge_df = pd.DataFrame(edge_list)
+    ids = np.arange(n_nodes, dtype=np.int32)
+    node_df = pd.DataFrame({"id": ids, "group": (ids % 20).astype(np.int16)}, copy=False)
+    graph.add_nodes(node_df, "Node", "id")
+
+    edge_df = pd.DataFrame({"src": edges["src"], "tgt": edges["tgt"]}, copy=False)
     graph.add_connections(edge_df, "LINKED", "Node", "src", "Node", "tgt")
 
-    # 15 highest-degree nodes (by outgoing edges)
-    degree_counts: dict[int, int] = {}
-    for s, _t in edge_set:
-        degree_counts[s] = degree_counts.get(s, 0) + 1
-    top_seeds = sorted(degree_counts, key=degree_counts.get, reverse=True)[:15]
+    return graph, seed_ids.tolist(), len(edges)
+
 
-    return graph, top_seeds, len(edge_set)
+def _edge_cache_dir(config: pytest.Config) -> Path | None:
+    """Directory for cached edge lists, or None when pytest's cacheprovider is disabled."""
+    cache = getattr(config, "cache", None)
+    return None if cache is None else Path(cache.mkdir("multihop_edges"))
 
 
 # ============================================================================
@@ -95,23 +189,23 @@ def _build_scale_free_graph(n_nodes: int, edges_per_node: int = 4, seed: int = 4
 
 
 @pytest.fixture(scope="module")
-def graph_1k():
-    return _build_scale_free_graph(1_000, edges_per_node=4)
+def graph_1k(pytestconfig):
+    return _warmed(_build_scale_free_graph(1_000, edges_per_node=4, cache_dir=_edge_cache_dir(pytestconfig)))
 
 
 @pytest.fixture(scope="module")
-def graph_10k():
-    return _build_scale_free_graph(10_000, edges_per_node=4)
+def graph_10k(pytestconfig):
+    return _warmed(_build_scale_free_graph(10_000, edges_per_node=4, cache_dir=_edge_cache_dir(pytestconfig)))
 
 
 @pytest.fixture(scope="module")
-def graph_50k():
-    return _build_scale_free_graph(50_000, edges_per_node=4)
+def graph_50k(pytestconfig):
+    return _warmed(_build_scale_free_graph(50_000, edges_per_node=4, cache_dir=_edge_cache_dir(pytestconfig)))
 
 
 @pytest.fixture(scope="module")
-def graph_100k():
-    return _build_scale_free_graph(100_000, edges_per_node=4)
+def graph_100k(pytestconfig):
+    return _warmed(_build_scale_free_graph(100_000, edges_per_node=4, cache_dir=_edge_cache_dir(pytestconfig)))
 
 
 # ============================================================================
@@ -121,20 +215,19 @@ def graph_100k():
 
 def _run_multihop(graph, seed_ids, hops, timeout_s=QUERY_TIMEOUT_S):
     """Run a multi-hop count query.  Returns (count, elapsed_ms) or (None, None) on timeout."""
-    seed_list = ", ".join(str(s) for s in seed_ids)
-
+    # Seeds are bound as `$seeds` so every run of a hop depth shares one query
+    # text (and parse-cache entry) regardless of graph size or seed set. Hop
+    # bounds must stay literal: `*1..N` is fixed at parse time.
     if hops == 1:
-        query = f"MATCH (n:Node)-[:LINKED]->(m:Node) WHERE n.id IN [{seed_list}] RETURN count(DISTINCT m) AS cnt"
+        query = "MATCH (n:Node)-[:LINKED]->(m:Node) WHERE n.id IN $seeds RETURN count(DISTINCT m) AS cnt"
     else:
-        query = (
-            f"MATCH (n:Node)-[:LINKED*1..{hops}]->(m:Node) WHERE n.id IN [{seed_list}] RETURN count(DISTINCT m) AS cnt"
-        )
+        query = f"MATCH (n:Node)-[:LINKED*1..{hops}]->(m:Node) WHERE n.id IN $seeds RETURN count(DISTINCT m) AS cnt"
 
     # Use KGLite's built-in timeout
     timeout_ms = int(timeout_s * 1000)
     start = time.perf_counter()
     try:
-        result = graph.cypher(query, timeout_ms=timeout_ms)
+        result = graph.cypher(query, params={"seeds": list(seed_ids)}, timeout_ms=timeout_ms)
         elapsed_ms = (time.perf_counter() - start) * 1000
         cnt = result[0]["cnt"]
         return cnt, elapsed_ms
@@ -145,6 +238,20 @@ def _run_multihop(graph, seed_ids, hops, timeout_s=QUERY_TIMEOUT_S):
         raise
 
 
+def _warmed(built):
+    """Run a discarded 1-hop and 2-hop query on a freshly built graph and return it.
+
+    The first query against a graph pays one-time costs -- parser warm-up and
+    the lazily built per-type adjacency that variable-length hops use -- which
+    would otherwise land in whichever timed cell runs first. The warm-up runs
+    with the full seed set because a single seed never builds the adjacency.
+    """
+    graph, seeds, _n_edges = built
+    for hops in (1, 2):
+        _run_multihop(graph, seeds, hops)
+    return built
+
+
 # ============================================================================
 # Parametrized benchmarks per graph size
 # ============================================================================
@@ -224,9 +331,8 @@ class TestMultiHopSummary:
         print("=" * 90)
 
         # Header
-        header = f"{'Graph':>15s} | {'Edges':>8s} | {'Build':>8s}"
-        for h in HOP_DEPTHS:
-            header += f" | {h}-hop{'':>8s}"
+        header_cells = [f"{'Graph':>15s}", f"{'Edges':>8s}", f"{'Build':>8s}"]
+        header = " | ".join(header_cells + [f"{h}-hop{'':>8s}" for h in HOP_DEPTHS])
         print(header)
         print("-" * len(header))
 
@@ -234,23 +340,26 @@ class TestMultiHopSummary:
             build_start = time.perf_counter()
             graph, seeds, n_edges = _build_scale_free_graph(n_nodes, epr)
             build_ms = (time.perf_counter() - build_start) * 1000
+            _warmed((graph, seeds, n_edges))
 
-            row = f"{n_nodes:>12,} n | {n_edges:>7,}e | {build_ms:>6.0f}ms"
+            # Cells are collected and joined once per graph size, so nothing
+            # but the queries runs between one hop's timing and the next.
+            parts = [f"{n_nodes:>12,} n", f"{n_edges:>7,}e", f"{build_ms:>6.0f}ms"]
             timed_out = False
 
             for hops in HOP_DEPTHS:
                 if timed_out:
-                    row += f" | {'--':>14s}"
+                    parts.append(f"{'--':>14s}")
                     continue
 
                 cnt, elapsed = _run_multihop(graph, seeds, hops)
                 if cnt is None:
-                    row += f" | {'TIMEOUT':>14s}"
+                    parts.append(f"{'TIMEOUT':>14s}")
                     timed_out = True
                 else:
-                    row += f" | {elapsed:>6.0f}ms ({cnt:>4,})"
+                    parts.append(f"{elapsed:>6.0f}ms ({cnt:>4,})")
 
-            print(row)
+            print(" | ".join(parts))
 
         print("=" * 90)
         print("(N) = distinct nodes reached from 15 seeds | -- = skipped after timeout")
@@ -265,18 +374,18 @@ class TestMultiHopSummary:
 class TestMultiHopSingleSeed:
     """Use a single seed node to test deeper hops without combinatorial blowup."""
 
-    SIZES = [1_000, 10_000]
-
     @pytest.mark.parametrize("hops", HOP_DEPTHS)
-    @pytest.mark.parametrize("n_nodes", [1_000, 10_000])
-    def test_single_seed(self, n_nodes, hops):
-        graph, seeds, n_edges = _build_scale_free_graph(n_nodes, edges_per_node=4)
+    @pytest.mark.parametrize("size", ["1k", "10k"])
+    def test_single_seed(self, request, size, hops):
+        # Same graphs as TestMultiHop1K/10K: reuse the module fixtures
+        # rather than building them again.
+        graph, seeds, _n_edges = request.getfixturevalue(f"graph_{size}")
         # Use only the top-1 seed
         cnt, elapsed = _run_multihop(graph, [seeds[0]], hops)
         if cnt is None:
-            print(f"  {n_nodes // 1000}K, 1 seed | {hops}-hop: TIMEOUT")
+            print(f"  {size.upper()}, 1 seed | {hops}-hop: TIMEOUT")
         else:
-            print(f"  {n_nodes // 1000}K, 1 seed | {hops}-hop: {elapsed:.1f}ms, {cnt:,} reached")
+            print(f"  {size.upper()}, 1 seed | {hops}-hop: {elapsed:.1f}ms, {cnt:,} reached")
 
 
 # ============================================================================
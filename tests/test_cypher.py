@@ -689,6 +689,24 @@ class TestExistingFeatures:
         assert "Bob" in names
         assert "Charlie" in names
 
+    def test_var_length_path_follows_edge_mutations(self, cypher_graph):
+        """The per-type adjacency behind a multi-seed `*lo..hi` count must track edge writes."""
+        query = """
+            MATCH (a:Person)<-[:KNOWS*1..3]-(b:Person)
+            WHERE a.name IN ['Diana', 'Eve']
+            RETURN count(DISTINCT b) AS n
+        """
+        assert cypher_graph.cypher(query)[0]["n"] == 4
+
+        cypher_graph.cypher("""
+            MATCH (e:Person {name: 'Eve'}), (a:Person {name: 'Alice'})
+            CREATE (e)-[:KNOWS]->(a)
+        """)
+        assert cypher_graph.cypher(query)[0]["n"] == 5
+
+        cypher_graph.cypher("MATCH (n:Person {name: 'Charlie'}) DETACH DELETE n")
+        assert cypher_graph.cypher(query)[0]["n"] == 1
+
     def test_coalesce_function(self, cypher_graph):
         rows = cypher_graph.cypher("""
             MATCH (n:Person)
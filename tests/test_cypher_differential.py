@@ -720,6 +720,44 @@ DIFFERENTIAL_QUERIES: list[tuple[str, str, str, dict | None]] = [
         "MATCH (p:Person {person_id: 1})-[:KNOWS*1..3]->(q:Person) RETURN count(DISTINCT q) AS n",
         None,
     ),
+    (
+        "var_length_no_var_unordered_aggregates",
+        "social_graph",
+        # Dedup-safe aggregates → fast target-dedup BFS. min/max keep
+        # the walk in edge-list order (see the mixed-type case below).
+        "MATCH (p:Person)-[:KNOWS*1..4]->(q:Person) WHERE p.city = 'Oslo' "
+        "RETURN count(DISTINCT q) AS n, min(q.age) AS lo, max(q.age) AS hi",
+        None,
+    ),
+    (
+        "var_length_no_var_mixed_type_min_max",
+        "social_graph",
+        # 1 and 1.0 compare equal and Int/String don't compare, so min/max
+        # keep whichever value arrives first: target emission order is
+        # observable and the BFS must not run direction-optimizing.
+        "MATCH (p:Person)-[:KNOWS*1..4]->(q:Person) WHERE p.city = 'Oslo' "
+        "RETURN min(CASE WHEN q.age % 2 = 0 THEN 1 ELSE 1.0 END) AS lo, "
+        "max(CASE WHEN q.age % 3 = 0 THEN q.age ELSE q.name END) AS hi",
+        None,
+    ),
+    # ── fuse_var_length_distinct_count ──
+    (
+        "trigger_var_length_distinct_count",
+        "social_graph",
+        # Multi-seed count(DISTINCT target): the seeds' reach sets overlap,
+        # so a per-seed sum would overcount.
+        "MATCH (p:Person)-[:KNOWS*1..3]->(q:Person) WHERE p.person_id IN [1, 2, 5] RETURN count(DISTINCT q) AS n",
+        None,
+    ),
+    (
+        "var_length_distinct_count_target_filter",
+        "social_graph",
+        # A target property filter is checked node by node rather than
+        # taking each seed's whole visited set.
+        "MATCH (p:Person)-[:KNOWS*1..3]->(q:Person {city: 'Oslo'}) WHERE p.person_id IN [1, 2, 5] "
+        "RETURN count(DISTINCT q) AS n",
+        None,
+    ),
     (
         "var_length_with_var",
         "small_graph",
@@ -2263,6 +2301,46 @@ def test_optimized_matches_naive(
         )
 
 
+# ── Error parity ─────────────────────────────────────────────────────
+#
+# Queries that must fail. A rewrite that evaluates the failing expression
+# somewhere else (a fused operator, a pushed-down filter) must surface
+# the same error rather than swallow it into an empty or zero result.
+
+DIFFERENTIAL_ERROR_QUERIES: list[tuple[str, str, str]] = [
+    (
+        "var_length_distinct_count_where_errors",
+        "social_graph",
+        # The seed filter is evaluated inside FusedVarLengthDistinctCount.
+        "MATCH (n:Person)-[:KNOWS*1..2]->(m) WHERE [1,2][n.name] = 1 RETURN count(DISTINCT m) AS n",
+    ),
+]
+
+
+@pytest.mark.differential
+@pytest.mark.parametrize(
+    "name,fixture,query",
+    DIFFERENTIAL_ERROR_QUERIES,
+    ids=[entry[0] for entry in DIFFERENTIAL_ERROR_QUERIES],
+)
+def test_optimized_raises_like_naive(name: str, fixture: str, query: str, request: pytest.FixtureRequest) -> None:
+    """Run `query` with optimizer off, on, and each pass disabled; assert the same error."""
+    g = request.getfixturevalue(fixture)
+
+    with pytest.raises(kglite.CypherExecutionError) as naive:
+        g.cypher(query, disable_optimizer=True).to_list()
+    with pytest.raises(kglite.CypherExecutionError) as optimized:
+        g.cypher(query).to_list()
+    assert str(optimized.value) == str(naive.value), f"Optimizer error divergence on `{name}`"
+
+    for pass_name in kglite.cypher_pass_names():
+        with pytest.raises(kglite.CypherExecutionError) as isolated:
+            g.cypher(query, disabled_passes=[pass_name]).to_list()
+        assert str(isolated.value) == str(naive.value), (
+            f"Single-pass isolation error divergence on `{name}` with `{pass_name}` disabled"
+        )
+
+
 # ── Known divergences (xfail) ────────────────────────────────────────
 #
 # These shapes diverge between optimized and naive but the divergence
@@ -2318,6 +2396,7 @@ PASS_TRIGGER_CASES: dict[str, tuple[str, str]] = {
         "disjoint_fixed_relationship_types",
     ),
     "mark_skip_target_type_check": ("differential", "anchored_three_hop"),
+    "fuse_var_length_distinct_count": ("differential", "trigger_var_length_distinct_count"),
 }
 
 # Independent shapes for shared-corpus passes which otherwise had only one
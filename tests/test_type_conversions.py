@@ -158,6 +158,31 @@ class TestPandasDtypes:
         node = graph.select("T").collect()[0]
         assert node["val"] == 42
 
+    def test_nullable_int64_with_missing_value(self, graph):
+        """Int64 shares the int kind with NumPy ints but still carries pd.NA."""
+        df = pd.DataFrame({"id": [1, 2], "name": ["A", "B"], "val": pd.array([42, None], dtype="Int64")})
+        graph.add_nodes(df, "T", "id", "name")
+        vals = {n["id"]: n.get("val") for n in graph.select("T").collect()}
+        assert vals == {1: 42, 2: None}
+
+    def test_narrow_numpy_int_columns(self, graph):
+        df = pd.DataFrame(
+            {
+                "id": pd.array([1, 2], dtype="int32"),
+                "name": ["A", "B"],
+                "small": pd.array([-3, 7], dtype="int8"),
+            }
+        )
+        graph.add_nodes(df, "T", "id", "name")
+        rows = graph.cypher("MATCH (n:T) RETURN n.id AS id, n.small AS small ORDER BY id").to_list()
+        assert rows == [{"id": 1, "small": -3}, {"id": 2, "small": 7}]
+
+    def test_object_id_column_of_mixed_numbers(self, graph):
+        """An object id column of ints and integral floats still resolves every id."""
+        df = pd.DataFrame({"id": pd.Series([1, 2.0, 3], dtype=object), "name": ["A", "B", "C"]})
+        graph.add_nodes(df, "T", "id", "name")
+        assert graph.cypher("MATCH (n:T) RETURN count(n) AS n").to_list() == [{"n": 3}]
+
     def test_float32_dtype(self, graph):
         df = pd.DataFrame({"id": [1], "name": ["A"], "val": pd.array([3.14], dtype="float32")})
         graph.add_nodes(df, "T", "id", "name")